@@ -0,0 +1,3 @@
+from bench.reconcile import main
+
+main()
@@ -0,0 +1,48 @@
+"""
+Measures Prop_Mapping.compute() and diff() over the Tk node schemas.
+
+    python -m bench.compute
+"""
+
+from timeit import repeat
+
+from react_tk.renderable.node.prop_value_accessor import PropValuesAccessor
+from react_tk.tk.nodes.button import Button
+from react_tk.tk.nodes.label import Label
+from react_tk.tk.nodes.window import Window
+from react_tk.tk.types.font import Font
+
+N = 5_000
+
+NODES = {
+    "Label": lambda text: Label(
+        text=text,
+        background="#000001",
+        foreground="#ffffff",
+        font=Font(family="Arial", size=20, style="bold"),
+    ).Pack(ipadx=20, ipady=15, fill="both"),
+    "Button": lambda text: Button(text=text, on_click=lambda: None),
+    "Window": lambda text: Window(topmost=True, background="black", alpha=85).Geometry(
+        width=500, height=500, x=500, y=500, anchor_point="lt"
+    ),
+}
+
+
+def report(name: str, fn) -> None:
+    best = min(repeat(fn, number=1, repeat=5))
+    print(f"  {name:<8} {N / best:>10,.0f}/s  ({best / N * 1e6:.2f}µs each)")
+
+
+def main() -> None:
+    for name, create in NODES.items():
+        a = PropValuesAccessor(create("a")).get()
+        same = PropValuesAccessor(create("a")).get()
+        b = PropValuesAccessor(create("b")).get()
+        print(name)
+        report("compute", lambda: [a.compute() for _ in range(N)])
+        report("diff", lambda: [a.diff(b) for _ in range(N)])
+        report("same", lambda: [a.diff(same) for _ in range(N)])
+
+
+if __name__ == "__main__":
+    main()
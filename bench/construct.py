@@ -0,0 +1,53 @@
+"""
+Measures node construction throughput, and the part of it spent capturing the
+construct trace in RenderableBase.__new__. "big" constructs from a function
+300 lines long, since the trace is looked up per code object.
+
+    python -m bench.construct
+"""
+
+from collections.abc import Callable
+from timeit import repeat
+
+from react_tk.renderable.renderable_base import RenderableBase
+
+from bench.stub import Stub
+
+N = 20_000
+
+
+class Bare(RenderableBase):
+    pass
+
+
+def construct_bare() -> None:
+    for _ in range(N):
+        Bare()
+
+
+def construct_stub() -> None:
+    for i in range(N):
+        Stub(text="x")
+
+
+def _big_function(lines: int) -> Callable[[], None]:
+    body = "".join(f"    x{i} = {i}\n" for i in range(lines))
+    source = f"def construct_big():\n{body}    for _ in range(N):\n        Bare()\n"
+    scope = {"N": N, "Bare": Bare}
+    exec(compile(source, "<big>", "exec"), scope)
+    return scope["construct_big"]
+
+
+def report(name: str, fn) -> None:
+    best = min(repeat(fn, number=1, repeat=5))
+    print(f"{name:<8} {N / best:>12,.0f} nodes/s  ({best / N * 1e6:.2f}µs each)")
+
+
+def main() -> None:
+    report("bare", construct_bare)
+    report("stub", construct_stub)
+    report("big", _big_function(300))
+
+
+if __name__ == "__main__":
+    main()
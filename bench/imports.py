@@ -0,0 +1,100 @@
+"""
+Measures what importing parts of react_tk loads, with `python -X importtime`,
+for the working tree and optionally another git revision.
+
+Each case runs in a fresh interpreter. Reported are the cumulative import time
+and the number of modules it loaded, beyond what the interpreter loads on its
+own. Times are medians; bytecode is compiled by a first run that isn't counted.
+
+    python -m bench.imports [--against REV] [--runs N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from statistics import median
+
+CASES = {
+    "import react_tk": "import react_tk",
+    "render core": "import react_tk.rendering.component.render_sink",
+    "Label": "from react_tk import Label",
+    "WindowRoot": "from react_tk import WindowRoot",
+}
+
+
+def importtime(statement: str, path: str) -> tuple[float, set[str]]:
+    """Seconds *statement* spent importing top-level modules, and what it
+    imported."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        # -c puts the working directory first on sys.path.
+        cwd=path,
+        env={**os.environ, "PYTHONPATH": path},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total = 0.0
+    modules = set[str]()
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):
+            total += int(cumulative) / 1e6
+    return total, modules
+
+
+def measure(path: str, runs: int) -> dict[str, tuple[float, int]]:
+    base_time, base = importtime("pass", path)
+    results = {}
+    for name, statement in CASES.items():
+        importtime(statement, path)
+        samples = [importtime(statement, path) for _ in range(runs)]
+        seconds = median(t for t, _ in samples) - base_time
+        results[name] = (seconds, len(samples[0][1] - base))
+    return results
+
+
+def checkout(rev: str, directory: str) -> str:
+    """Extracts react_tk as of *rev* into *directory*."""
+    archive = subprocess.run(
+        ["git", "archive", rev, "react_tk"], capture_output=True, check=True
+    ).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(directory, filter="data")
+    return directory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--against", metavar="REV")
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+    here = measure(str(Path(__file__).parents[1]), args.runs)
+    print(f"{'':<16} {'now':>18}", end="")
+    if args.against:
+        with tempfile.TemporaryDirectory() as directory:
+            there = measure(checkout(args.against, directory), args.runs)
+        print(f" {args.against:>18}")
+    else:
+        there = {}
+        print()
+    for name, (seconds, modules) in here.items():
+        print(f"{name:<16} {seconds * 1e3:>7.1f}ms {modules:>4} modules", end="")
+        if name in there:
+            seconds, modules = there[name]
+            print(f" {seconds * 1e3:>7.1f}ms {modules:>4} modules", end="")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Profiles a reconcile pass in which every node changes, and reports how much of
+it goes to building ShadowNodeInfo objects and formatting render trace ids.
+
+    python -m bench.info_profile
+"""
+
+import cProfile
+import pstats
+
+from react_tk.renderable.component import AbsCtx
+from react_tk.rendering.actions.reconcile_state import PersistentReconcileState
+from react_tk.rendering.actions.top_reconciler import RootReconciler
+from react_tk.rendering.component.render_sink import RenderState
+
+from bench.stub import Stub
+
+WATCHED = ("from_node", "to_string", "uid", "__info__")
+
+
+def tree(text: str, width: int = 40, depth: int = 25):
+    return Stub(key="root")[
+        [
+            Stub(key=f"col{i}")[[Stub(text=f"{text}{j}") for j in range(depth)]]
+            for i in range(width)
+        ]
+    ]
+
+
+def render(text: str):
+    return RenderState(AbsCtx()).create_empty_sink().run(tree(text))
+
+
+def main() -> None:
+    reconciler = RootReconciler(PersistentReconcileState())
+    reconciler.reconcile(render("a"))
+    changed = render("b")
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    reconciler.reconcile(changed)
+    profiler.disable()
+
+    stats = pstats.Stats(profiler)
+    total = max(v[3] for v in stats.stats.values())  # type: ignore[attr-defined]
+    print(f"reconcile total: {total * 1000:.1f}ms")
+    for (_, _, name), (_, ncalls, _, cumtime, _) in sorted(
+        stats.stats.items(), key=lambda x: -x[1][3]  # type: ignore[attr-defined]
+    ):
+        if name in WATCHED:
+            print(
+                f"  {name:<12} {ncalls:>8} calls {cumtime * 1000:>8.1f}ms"
+                f" ({cumtime / total:.0%})"
+            )
+
+
+if __name__ == "__main__":
+    main()
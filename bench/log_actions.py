@@ -0,0 +1,97 @@
+"""
+Times the RECONCILE log line the Tk reconcilers write for every action they
+run on the main thread, as an f-string built up front and as a deferred
+ActionLogLine.
+
+The actions come from two frames of a headless Stub tree. The first frame
+places every node and the second changes every leaf's text. Each log site is
+timed with the logger at WARNING, where nothing is emitted, and at INFO with a
+handler that discards what it's given.
+
+    python -m bench.log_actions [--width 6] [--depth 3]
+"""
+
+import argparse
+import logging
+from collections.abc import Callable
+from io import StringIO
+from timeit import repeat
+from typing import Any
+
+from react_tk.renderable.component import AbsCtx
+from react_tk.renderable.node.top import TopLevelNode
+from react_tk.rendering.actions.actions import ActionLogLine, ReconcileAction
+from react_tk.rendering.actions.commit_batch import group_batches
+from react_tk.rendering.actions.compute import ComputeTreeActions
+from react_tk.rendering.actions.reconcile_state import (
+    PersistentReconcileState,
+    RenderedNode,
+)
+from react_tk.rendering.component.render_sink import RenderState
+
+from bench.trees import TreeShape, text
+
+logger = logging.getLogger("react_tk")
+
+
+def frame_actions(state: PersistentReconcileState, tree: Any) -> list[Any]:
+    rendered = RenderState(AbsCtx()).create_empty_sink().run(tree)
+    top = TopLevelNode(KIDS=rendered, key="top")
+    transient = state.new_transient()
+    actions = [*ComputeTreeActions(transient).compute_actions(top)]
+    transient.overwrite(RenderedNode(object(), top))
+    for batch in group_batches(actions):
+        batch.run(transient)
+    state.from_transient(transient)
+    return actions
+
+
+def eager(action: ReconcileAction[Any]) -> None:
+    if action:
+        logger.info(f"⚖️  RECONCILE {action}")
+    else:
+        logger.info(f"🚫 RECONCILE {action.key} ")
+
+
+def deferred(action: ReconcileAction[Any]) -> None:
+    logger.info("%s", ActionLogLine(action))
+
+
+def per_action(
+    log: Callable[[ReconcileAction[Any]], None], actions: list[Any]
+) -> float:
+    def run() -> None:
+        for action in actions:
+            log(action)
+
+    return min(repeat(run, number=1, repeat=7)) / len(actions)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=6)
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+    shape = TreeShape(args.width, args.depth)
+    state = PersistentReconcileState()
+    frames = {
+        "place": frame_actions(state, text(shape, 0)),
+        "update": frame_actions(state, text(shape, 1)),
+    }
+    handler = logging.StreamHandler(StringIO())
+    logger.addHandler(handler)
+    logger.propagate = False
+    print(f"{'':<8}{'level':<9}{'f-string':>11}{'deferred':>11}")
+    for level in (logging.WARNING, logging.INFO):
+        logger.setLevel(level)
+        for name, actions in frames.items():
+            before = per_action(eager, actions)
+            after = per_action(deferred, actions)
+            print(
+                f"{name:<8}{logging.getLevelName(level):<9}"
+                f"{before * 1e6:>9.2f}µs{after * 1e6:>9.2f}µs"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Measures what fluent setter chains allocate: `Label(...).Pack(...)[...]`, each
+step of which merges new values into the node's props.
+
+Every intermediate node is kept alive while measuring, so the bytes reported
+are what the steps allocated, not what was left once they were collected. The
+values of the last node in each chain are read, like rendering would.
+
+    python -m bench.merge
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+from timeit import repeat
+from typing import Any
+
+from react_tk.renderable.node.prop_value_accessor import PropValuesAccessor
+from react_tk.tk.nodes.frame import Frame
+from react_tk.tk.nodes.label import Label
+from react_tk.tk.types.font import Font
+
+N = 2_000
+
+
+def chain(keep: list[Any]) -> None:
+    for i in range(N):
+        node = Label(text=str(i), background="red", border_width=1, width=10)
+        keep.append(node)
+        node = node.Pack(side="left", fill="x", ipadx=2)
+        keep.append(node)
+        node = node.Pack(expand=True)
+        keep.append(node)
+        keep.append(node[()])
+        PropValuesAccessor(keep[-1]).get().raw
+
+
+def wide(keep: list[Any]) -> None:
+    for i in range(N):
+        node = Label(
+            text=str(i),
+            font=Font(),
+            foreground="black",
+            justify="left",
+            wraplength=200,
+            border_width=1,
+            relief="flat",
+            background="red",
+            width=10,
+            height=2,
+        )
+        keep.append(node)
+        for side in ("left", "right", "top", "bottom"):
+            node = node.Pack(side=side, fill="x")
+            keep.append(node)
+        keep.append(node[()])
+        PropValuesAccessor(keep[-1]).get().raw
+
+
+def nested(keep: list[Any]) -> None:
+    for _ in range(N // 10):
+        kids = [Label(text=str(i)).Pack(side="top") for i in range(10)]
+        frame = Frame(background="blue").Pack(fill="both")
+        keep.extend((*kids, frame, frame[tuple(kids)]))
+        for node in keep[-2:]:
+            PropValuesAccessor(node).get().raw
+
+
+def kept_bytes(fn: Callable[[list[Any]], None]) -> float:
+    fn([])
+    gc.collect()
+    tracemalloc.start()
+    keep: list[Any] = []
+    fn(keep)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / N
+
+
+def report(name: str, fn: Callable[[list[Any]], None]) -> None:
+    best = min(repeat(lambda: fn([]), number=1, repeat=5))
+    print(f"{name:<8} {best / N * 1e6:>8.2f}µs {kept_bytes(fn):>10,.0f} B per chain")
+
+
+def main() -> None:
+    report("chain", chain)
+    report("wide", wide)
+    report("nested", nested)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Times each stage of a frame over synthetic trees, using the headless stub
+reconciler, and optionally writes the results as JSON for tracking between
+releases.
+
+    python -m bench.reconcile
+    python -m bench.reconcile --pattern reorder --width 8 --depth 3 --json out.json
+
+Stages:
+    build     constructing the Stub elements
+    render    RenderSink.run
+    walk      ComputeTreeActions.compute_actions, minus the two below
+    actions   building each action (Create computes its props here)
+    diff      diffing the props of nodes that already exist
+    commit    running the action batches against the stub reconciler
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import wraps
+from statistics import median
+from time import perf_counter
+from typing import Any
+
+from react_tk.renderable.component import AbsCtx
+from react_tk.renderable.node.top import TopLevelNode
+from react_tk.rendering.actions.commit_batch import group_batches
+from react_tk.rendering.actions.compute import ComputeTreeActions, _ComputeAction
+from react_tk.rendering.actions.top_reconciler import evict_unplaced
+from react_tk.rendering.actions.reconcile_state import (
+    PersistentReconcileState,
+    RenderedNode,
+)
+from react_tk.rendering.component.render_sink import RenderState
+from react_tk.rendering.component.validation import Validator
+from react_tk.rendering.options import ValidationMode
+
+from bench.trees import PATTERNS, TreeShape
+
+STAGES = ("build", "render", "walk", "actions", "diff", "commit")
+
+
+class Stopwatch:
+    def __init__(self) -> None:
+        self.totals: dict[str, float] = dict.fromkeys(STAGES, 0.0)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] += perf_counter() - started
+
+    @contextmanager
+    def wrapping(self, owner: type, attr: str, name: str) -> Iterator[None]:
+        """Times every call to `owner.attr` for the duration of the block."""
+        original = getattr(owner, attr)
+
+        @wraps(original)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self.stage(name):
+                return original(*args, **kwargs)
+
+        setattr(owner, attr, timed)
+        try:
+            yield
+        finally:
+            setattr(owner, attr, original)
+
+
+@dataclass
+class Result:
+    pattern: str
+    width: int
+    depth: int
+    nodes: int
+    frames: int
+    validate: str
+    median_ms: dict[str, float] = field(default_factory=dict)
+    min_ms: dict[str, float] = field(default_factory=dict)
+    actions: dict[str, int] = field(default_factory=dict)
+    resident: int = field(default=0)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.median_ms.values())
+
+
+class Harness:
+    """Runs frames through the same steps as RenderRoot and RootReconciler,
+    timing each step separately."""
+
+    def __init__(self, validate: ValidationMode, evict_after: int | None) -> None:
+        self.evict_after = evict_after
+        self.state = PersistentReconcileState()
+        self.validator = Validator(validate)
+        self.actions: Counter[str] = Counter()
+
+    def frame(self, build: Callable[[], Any]) -> dict[str, float]:
+        watch = Stopwatch()
+        with watch.stage("build"):
+            tree = build()
+        with watch.stage("render"):
+            sink = RenderState(AbsCtx(), validate=self.validator).create_empty_sink()
+            rendered = sink.run(tree)
+        top = TopLevelNode(KIDS=rendered, key="top")
+        transient = self.state.new_transient()
+        with (
+            watch.wrapping(_ComputeAction, "_diff", "diff"),
+            watch.wrapping(_ComputeAction, "compute", "actions"),
+            watch.stage("walk"),
+        ):
+            actions = [*ComputeTreeActions(transient).compute_actions(top)]
+        transient.overwrite(RenderedNode(object(), top))
+        with watch.stage("commit"):
+            for batch in group_batches(actions):
+                batch.run(transient)
+        self.state.from_transient(transient)
+        if self.evict_after is not None:
+            evict_unplaced(self.state, self.evict_after)
+        self.actions.update(type(a).__name__ for a in actions)
+
+        # The wrapped stages are nested inside the ones around them.
+        watch.totals["actions"] -= watch.totals["diff"]
+        watch.totals["walk"] -= watch.totals["actions"] + watch.totals["diff"]
+        return watch.totals
+
+
+def run(
+    pattern: str,
+    shape: TreeShape,
+    frames: int,
+    warmup: int,
+    validate: ValidationMode,
+    evict_after: int | None = None,
+) -> Result:
+    churn = PATTERNS[pattern]
+    harness = Harness(validate, evict_after)
+    for i in range(warmup):
+        harness.frame(lambda: churn(shape, i))
+    harness.actions.clear()
+
+    samples: list[dict[str, float]] = []
+    gc.collect()
+    gc.disable()
+    try:
+        for i in range(warmup, warmup + frames):
+            samples.append(harness.frame(lambda: churn(shape, i)))
+    finally:
+        gc.enable()
+
+    return Result(
+        pattern=pattern,
+        width=shape.width,
+        depth=shape.depth,
+        nodes=shape.nodes,
+        frames=frames,
+        validate=validate,
+        median_ms={s: median(x[s] for x in samples) * 1000 for s in STAGES},
+        min_ms={s: min(x[s] for x in samples) * 1000 for s in STAGES},
+        actions=dict(harness.actions),
+        resident=len(harness.state.existing_resources),
+    )
+
+
+def print_table(results: list[Result]) -> None:
+    header = f"{'pattern':<9}{'nodes':>7}" + "".join(f"{s:>9}" for s in STAGES)
+    print(header + f"{'total':>9}{'resident':>10}  (median ms per frame)")
+    for r in results:
+        row = f"{r.pattern:<9}{r.nodes:>7}"
+        row += "".join(f"{r.median_ms[s]:>9.2f}" for s in STAGES)
+        print(row + f"{r.total_ms:>9.2f}{r.resident:>10}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.reconcile")
+    parser.add_argument(
+        "--pattern", choices=[*PATTERNS, "all"], default="all", help="churn pattern"
+    )
+    parser.add_argument("--width", type=int, default=10, help="kids per node")
+    parser.add_argument("--depth", type=int, default=3, help="levels below the root")
+    parser.add_argument("--frames", type=int, default=20, help="timed frames")
+    parser.add_argument("--warmup", type=int, default=4, help="untimed frames")
+    parser.add_argument(
+        "--validate",
+        choices=["always", "first-seen", "sampled", "off"],
+        default="always",
+    )
+    parser.add_argument(
+        "--evict-after", type=int, help="renders before unplaced nodes are evicted"
+    )
+    parser.add_argument("--json", metavar="PATH", help="also write results here")
+    args = parser.parse_args(argv)
+
+    shape = TreeShape(args.width, args.depth)
+    patterns = [*PATTERNS] if args.pattern == "all" else [args.pattern]
+    results = [
+        run(p, shape, args.frames, args.warmup, args.validate, args.evict_after)
+        for p in patterns
+    ]
+    print_table(results)
+
+    if args.json:
+        report = {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "results": [asdict(r) for r in results],
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Measures how long importing everything react_tk exports takes in a fresh
+interpreter, and how long reading the props schemas of its node classes takes,
+which is the part a schema cache skips.
+
+Each run imports in a new subprocess: without a schema cache, with an empty
+one that gets filled, and with a filled one. The medians are reported.
+
+    python -m bench.startup [--runs N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from statistics import median
+
+from timeit import repeat
+
+import react_tk
+from react_tk.props.annotations import create_props
+from react_tk.props.annotations.schema_cache import ENV_VAR
+from react_tk.renderable.node.prop_value_accessor import PropsAccessor
+from react_tk.renderable.node.shadow_node import HasPropsSchema
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+from react_tk import *
+print(time.perf_counter() - start)
+"""
+
+
+def run(env: dict[str, str]) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(out)
+
+
+def report(name: str, times: list[float]) -> None:
+    print(f"{name:<10} {median(times) * 1e3:>7.1f}ms")
+
+
+def cold(env: dict[str, str]) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        return run({**env, ENV_VAR: directory})
+
+
+def node_classes() -> list[type]:
+    # The package imports its exports lazily, so load them all first.
+    for name in react_tk.__all__:
+        getattr(react_tk, name)
+    classes, todo = [], [HasPropsSchema]
+    while todo:
+        cls = todo.pop()
+        todo.extend(cls.__subclasses__())
+        if PropsAccessor(cls):
+            classes.append(cls)
+    return classes
+
+
+def reflection(runs: int) -> float:
+    """Seconds to read the schemas of every node class, partials included."""
+    classes = node_classes()
+
+    def read_all() -> None:
+        create_props._partials.clear()
+        for cls in classes:
+            create_props._read_top_class(cls)
+
+    return min(repeat(read_all, number=1, repeat=runs))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+    env = {k: v for k, v in os.environ.items() if k != ENV_VAR}
+    run(env)
+    report("no cache", [run(env) for _ in range(args.runs)])
+    report("cold", [cold(env) for _ in range(args.runs)])
+    with tempfile.TemporaryDirectory() as directory:
+        warm = {**env, ENV_VAR: directory}
+        run(warm)
+        report("warm", [run(warm) for _ in range(args.runs)])
+    print(f"reflecting on {len(node_classes())} node classes: ", end="")
+    print(f"{reflection(args.runs) * 1e3:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
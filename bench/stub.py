@@ -0,0 +1,149 @@
+"""
+A headless node type whose reconciler keeps plain Python objects instead of Tk
+widgets, so the whole reconcile loop runs without a display. Shared by the tests
+and the benchmarks.
+"""
+
+from dataclasses import dataclass, field
+from typing import Annotated, Any, ClassVar, NotRequired, Unpack
+
+from react_tk.props.annotations import prop_meta, schema_setter
+from react_tk.renderable.component import AbsCtx, RenderResult
+from react_tk.renderable.node.shadow_node import NodeProps, ShadowNode
+from react_tk.rendering.actions.actions import (
+    Compat,
+    Create,
+    Place,
+    ReconcileAction,
+    Replace,
+    Unplace,
+    Update,
+)
+from react_tk.rendering.actions.node_reconciler import ReconcilerBase, reconciler
+from react_tk.rendering.actions.reconcile_state import (
+    PersistentReconcileState,
+    RenderedNode,
+    TransientReconcileState,
+    same_identity,
+)
+from react_tk.rendering.actions.top_reconciler import RootReconciler
+from react_tk.rendering.component.render_sink import RenderState
+
+
+@dataclass(eq=False)
+class StubResource:
+    placed: bool = field(default=False)
+    props: dict[str, Any] = field(default_factory=dict)
+    # Placed children in order, like a Tk container's pack slaves.
+    kids: list["StubResource"] = field(default_factory=list)
+    parent: "StubResource | None" = field(default=None)
+    evicted: bool = field(default=False)
+
+    def detach(self) -> None:
+        if self.parent:
+            self.parent.kids.remove(self)
+            self.parent = None
+
+    def attach(self, parent: "StubResource", after: "StubResource | None") -> None:
+        self.detach()
+        self.parent = parent
+        parent.kids.insert(parent.kids.index(after) + 1 if after else 0, self)
+
+
+@dataclass
+class StubReconciler(ReconcilerBase[StubResource]):
+    # The actions run, while a StubRoot is collecting them.
+    log: ClassVar[list[ReconcileAction[Any]] | None] = None
+
+    @classmethod
+    def create(cls, state: TransientReconcileState) -> "StubReconciler":
+        return cls(state)
+
+    @classmethod
+    def get_compatibility(
+        cls, older: RenderedNode[StubResource], newer: ShadowNode[Any]
+    ) -> Compat:
+        if not same_identity(older.node, newer):
+            return "switch"
+        if not older.resource.placed:
+            return "place"
+        return "update"
+
+    def _prepare(
+        self, action: "Create[StubResource] | Update[StubResource]"
+    ) -> StubResource:
+        match action:
+            case Create(next):
+                resource = StubResource(props=dict(action.diff.values))
+                self._register(next, resource)
+                return resource
+            case Update(existing, next, diff):
+                existing.resource.props.update(diff.values)
+                existing.migrate(next)
+                return existing.resource
+            case _:
+                assert False, f"Unknown action: {action}"
+
+    def _unplace(self, rendered: RenderedNode[StubResource]) -> None:
+        if not self.state.will_be_placed(rendered.node):
+            rendered.resource.placed = False
+            rendered.resource.detach()
+
+    def _place(self, container: ShadowNode[Any], at: int, resource: StubResource):
+        resource.placed = True
+        parent = self.state[container].resource
+        if isinstance(parent, StubResource):
+            previous = self._previous_sibling(container, at)
+            resource.attach(parent, previous.resource if previous else None)
+
+    def evict(self, rendered: RenderedNode[StubResource]) -> None:
+        rendered.resource.evicted = True
+
+    def run_action(self, action: ReconcileAction[StubResource]) -> None:
+        if self.log is not None:
+            self.log.append(action)
+        match action:
+            case Replace(container, replaces, with_what, at):
+                self._unplace(replaces)
+                self._place(container, at, self._prepare(with_what))
+            case Update():
+                self._prepare(action)
+            case Unplace(existing):
+                self._unplace(existing)
+            case Place(container, at, with_what):
+                self._place(container, at, self._prepare(with_what))
+
+
+class StubProps(NodeProps):
+    text: Annotated[NotRequired[str], prop_meta(no_value="")]
+
+
+@reconciler(StubReconciler)
+class Stub(ShadowNode[Any]):
+    @schema_setter()
+    def __init__(self, **props: Unpack[StubProps]) -> None: ...
+
+
+class StubRoot:
+    def __init__(self, evict_after: int | None = None) -> None:
+        self.reconciler = RootReconciler(
+            PersistentReconcileState(), evict_after=evict_after
+        )
+
+    def __call__(self, what: RenderResult[Any]) -> list[ReconcileAction[Any]]:
+        rendered = RenderState(AbsCtx()).create_empty_sink().run(what)
+        StubReconciler.log = log = []
+        try:
+            self.reconciler.reconcile(rendered)
+        finally:
+            StubReconciler.log = None
+        return log
+
+    def placed_keys(self, node: ShadowNode[Any]) -> list[str]:
+        """Keys of the children placed in *node*'s resource, in order."""
+        resource = self.reconciler.state[node].resource
+        by_resource = {
+            id(r.resource): r.node.key
+            for r in self.reconciler.state.existing_resources.values()
+        }
+        return [by_resource[id(kid)] for kid in resource.kids]
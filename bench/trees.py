@@ -0,0 +1,85 @@
+"""
+Synthetic trees of headless Stub nodes, and the churn patterns that change them
+from one frame to the next.
+
+Every node is keyed by its path, so the same logical node keeps its identity
+across frames whichever way its siblings move. Patterns alternate between two
+shapes, so a run of any length stays the same size.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from bench.stub import Stub
+
+type Pattern = Callable[["TreeShape", int], Stub]
+
+
+@dataclass(frozen=True)
+class TreeShape:
+    width: int
+    depth: int
+
+    @property
+    def nodes(self) -> int:
+        return 1 + sum(self.width**level for level in range(1, self.depth + 1))
+
+    def subtree(self, path: str, level: int, text: str = "") -> Stub:
+        node = Stub(key=path, text=f"{path}{text}" if level == self.depth else "")
+        if level == self.depth:
+            return node
+        return node[
+            [self.subtree(f"{path}.{i}", level + 1, text) for i in range(self.width)]
+        ]
+
+    def kids(self, text: str = "") -> list[Stub]:
+        return [self.subtree(f"n{i}", 1, text) for i in range(self.width)]
+
+    def root(self, kids: list[Stub]) -> Stub:
+        return Stub(key="root")[kids]
+
+
+def text(shape: TreeShape, frame: int) -> Stub:
+    """Every leaf's text changes, nothing moves."""
+    return shape.root(shape.kids(f"@{frame}"))
+
+
+def append(shape: TreeShape, frame: int) -> Stub:
+    """An extra subtree is added after the last top-level one, then removed."""
+    kids = shape.kids()
+    if frame % 2:
+        kids.append(shape.subtree("extra", 1))
+    return shape.root(kids)
+
+
+def prepend(shape: TreeShape, frame: int) -> Stub:
+    """An extra subtree is added before the first top-level one, then removed."""
+    kids = shape.kids()
+    if frame % 2:
+        kids.insert(0, shape.subtree("extra", 1))
+    return shape.root(kids)
+
+
+def reorder(shape: TreeShape, frame: int) -> Stub:
+    """The top-level subtrees swap between forward and reverse order."""
+    kids = shape.kids()
+    if frame % 2:
+        kids.reverse()
+    return shape.root(kids)
+
+
+def toggle(shape: TreeShape, frame: int) -> Stub:
+    """The middle top-level subtree is removed, then put back."""
+    kids = shape.kids()
+    if frame % 2:
+        del kids[len(kids) // 2]
+    return shape.root(kids)
+
+
+PATTERNS: dict[str, Pattern] = {
+    "text": text,
+    "append": append,
+    "prepend": prepend,
+    "reorder": reorder,
+    "toggle": toggle,
+}
@@ -1,14 +1,51 @@
-from react_tk.tk.nodes.frame import Frame
-from react_tk.tk.nodes.label import Label
-from react_tk.tk.nodes.button import Button
-from react_tk.tk.types.font import Font
-from react_tk.tk.nodes.widget import Widget
-from react_tk.tk.types.geometry import Geometry
-from react_tk.tk.nodes.tool_tip_label import ToolTipLabel
-from react_tk.tk.nodes.window import Window
-from react_tk.renderable.component import Component
-from react_tk.renderable.context import Ctx
-from react_tk.tk.mount import WindowRoot
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from react_tk.tk.nodes.frame import Frame
+    from react_tk.tk.nodes.label import Label
+    from react_tk.tk.nodes.button import Button
+    from react_tk.tk.types.font import Font
+    from react_tk.tk.nodes.widget import Widget
+    from react_tk.tk.types.geometry import Geometry
+    from react_tk.tk.nodes.tool_tip_label import ToolTipLabel
+    from react_tk.tk.nodes.window import Window
+    from react_tk.renderable.component import Component, memo
+    from react_tk.renderable.context import Ctx
+    from react_tk.tk.mount import WindowRoot
+    from react_tk.rendering.options import RenderOptions
+
+# Each export is imported when it's first accessed, so processes that only use
+# part of react_tk, like the render core without Tk, don't load the rest.
+_exports = {
+    "Frame": "react_tk.tk.nodes.frame",
+    "Label": "react_tk.tk.nodes.label",
+    "Button": "react_tk.tk.nodes.button",
+    "Font": "react_tk.tk.types.font",
+    "Widget": "react_tk.tk.nodes.widget",
+    "Geometry": "react_tk.tk.types.geometry",
+    "ToolTipLabel": "react_tk.tk.nodes.tool_tip_label",
+    "Window": "react_tk.tk.nodes.window",
+    "Component": "react_tk.renderable.component",
+    "memo": "react_tk.renderable.component",
+    "Ctx": "react_tk.renderable.context",
+    "WindowRoot": "react_tk.tk.mount",
+    "RenderOptions": "react_tk.rendering.options",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_exports})
+
 
 __all__ = [
     "Frame",
@@ -20,6 +57,8 @@ __all__ = [
     "ToolTipLabel",
     "Window",
     "Component",
+    "memo",
     "Ctx",
     "WindowRoot",
+    "RenderOptions",
 ]
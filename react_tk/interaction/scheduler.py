@@ -1,27 +1,90 @@
-from asyncio import AbstractEventLoop
+from asyncio import AbstractEventLoop, TimerHandle
 from collections.abc import Callable
-from copy import copy
 from dataclasses import dataclass, field
+from functools import partial
 from logging import getLogger
-from operator import methodcaller
-from typing import Any, Callable, TypeVar, ParamSpec
-from react_tk.util.async_loop import create_event_loop
+import threading
+from typing import Any
+from weakref import finalize
+
+from react_tk.util.async_loop import shared_loop
 
 logger = getLogger("react_tk")
 
 
-class _bind_schedule(type):
+def _bound[S](cls: type[S], parent: "Scheduler", *args: Any, **kwargs: Any) -> S:
+    bound = cls(*args, **kwargs)
+    bound.parent = parent  # type: ignore[attr-defined]
+    return bound
 
-    def __get__(
-        self, instance: "Scheduler | None", owner: "type[Scheduler]"
-    ) -> "type[_schedule]":
-        if not instance:
-            return self  # type: ignore[return-value]
 
-        class bound_schedule(_schedule):
-            parent = instance
+class _bind_schedule(type):
 
-        return bound_schedule
+    def __get__[S](self: type[S], instance: "Scheduler | None", owner: Any) -> type[S]:
+        if not instance:
+            return self
+        # Not a subclass per access, since creating classes is slow.
+        return partial(_bound, self, instance)  # type: ignore[return-value]
+
+
+class ScheduleHandle:
+    """A call scheduled on a scheduler's loop.
+
+    `cancel()` keeps it from running again and can be called from any thread.
+    With an `interval`, it runs every `interval` seconds until cancelled,
+    skipping the ticks it fell too far behind to make.
+    """
+
+    def __init__(
+        self,
+        loop: AbstractEventLoop,
+        fqn: str,
+        run: Callable[[], Any],
+        interval: float | None = None,
+    ) -> None:
+        self.fqn = fqn
+        self.interval = interval
+        self.cancelled = False
+        self._loop = loop
+        self._run = run
+        self._timer: TimerHandle | None = None
+        self._due = 0.0
+
+    def __repr__(self) -> str:
+        return f"<{self.fqn}{' cancelled' if self.cancelled else ''}>"
+
+    def __call__(self) -> Any:
+        return self._run()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        if (timer := self._timer) is not None:
+            self._loop.call_soon_threadsafe(timer.cancel)
+
+    def _start(self, delay: float) -> None:
+        self._loop.call_soon_threadsafe(self._arm, delay)
+
+    def _arm(self, delay: float) -> None:
+        self._due = self._loop.time() + delay
+        self._arm_at(self._due)
+
+    def _arm_at(self, when: float) -> None:
+        if not self.cancelled:
+            self._timer = self._loop.call_at(when, self._fire)
+
+    def _fire(self) -> None:
+        self._timer = None
+        if self.cancelled:
+            return
+        if self.interval is not None:
+            self._due += self.interval
+            if (behind := self._loop.time() - self._due) > 0:
+                self._due += (behind // self.interval + 1) * self.interval
+            self._arm_at(self._due)
+        try:
+            self._run()
+        except Exception:
+            logger.exception("Failed to run [%s]", self.fqn)
 
 
 @dataclass(kw_only=True)
@@ -44,12 +107,13 @@ class _schedule(ScheduleInfo, metaclass=_bind_schedule):
 
     def __call__[**P](
         self, func: Callable[P, None], *args: P.args, **kwargs: P.kwargs
-    ) -> Callable[[], None]:
-        orig_state = copy(self.parent)
+    ) -> ScheduleHandle:
+        parent = self.parent
+        orig_version = parent._version
         fqn = self.fqn(func)
 
         def _wrapped():
-            if orig_state == self.parent:
+            if orig_version == parent._version:
                 logger.debug("Running [%s]", fqn)
                 return func(*args, **kwargs)
             elif self.always_run:
@@ -58,17 +122,86 @@ class _schedule(ScheduleInfo, metaclass=_bind_schedule):
             else:
                 logger.debug("Skipping [%s] due to context change", fqn)
 
-        self.parent._loop.call_soon_threadsafe(
-            self.parent._loop.call_later, self.delay, _wrapped
-        )
-        return _wrapped
+        handle = ScheduleHandle(parent._loop, fqn, _wrapped)
+        handle._start(self.delay)
+        return handle
+
+
+@dataclass(kw_only=True)
+class _every(metaclass=_bind_schedule):
+    interval: float
+    name: str | None = None
+    parent: "Scheduler" = field(
+        init=False,
+        repr=False,
+    )
+
+    def __call__[**P](
+        self, func: Callable[P, None], *args: P.args, **kwargs: P.kwargs
+    ) -> ScheduleHandle:
+        fqn = f"{self.name or 'every'}({func.__name__})"
+        run = partial(func, *args, **kwargs)
+        handle = ScheduleHandle(self.parent._loop, fqn, run, self.interval)
+        handle._start(self.interval)
+        return handle
 
 
 class Scheduler:
     _loop: AbstractEventLoop
+    # Bumped whenever the state schedules depend on changes, so a schedule can
+    # tell it changed without keeping a copy.
+    _version: int = 0
+    # Seconds between animation frames.
+    frame_interval: float = 1 / 60
+    _last_frame: float = 0.0
+    _frame_lock: threading.Lock
+    _next_frame: list[ScheduleHandle]
 
     def __init__(self, trace_name: str) -> None:
-        self._loop = create_event_loop(trace_name)
+        self._hold_loop()
+        self._frame_lock = threading.Lock()
+        self._next_frame = []
+
+    def _hold_loop(self) -> None:
+        # All schedulers share one loop, held for as long as they live.
+        self._loop = shared_loop.acquire()
+        finalize(self, shared_loop.release)
 
     class schedule(_schedule):
-        pass
+        """Runs a function once after `delay` seconds, unless the context has
+        changed by then and it isn't `always_run`."""
+
+    class every(_every):
+        """Runs a function every `interval` seconds until it's cancelled,
+        whatever the context does."""
+
+    def next_frame[**P](
+        self, func: Callable[P, None], *args: P.args, **kwargs: P.kwargs
+    ) -> ScheduleHandle:
+        """Runs a function once, on the next animation frame.
+
+        Frames come at most every `frame_interval` seconds. Everything requested
+        for a frame runs in one go, so the context changes they make are
+        rendered together. A function can request the next frame from inside
+        to keep animating.
+        """
+        handle = ScheduleHandle(
+            self._loop, f"next_frame({func.__name__})", partial(func, *args, **kwargs)
+        )
+        with self._frame_lock:
+            self._next_frame.append(handle)
+            first = len(self._next_frame) == 1
+        if first:
+            self._loop.call_soon_threadsafe(self._request_frame)
+        return handle
+
+    def _request_frame(self) -> None:
+        delay = self._last_frame + self.frame_interval - self._loop.time()
+        self._loop.call_later(max(0.0, delay), self._run_frame)
+
+    def _run_frame(self) -> None:
+        self._last_frame = self._loop.time()
+        with self._frame_lock:
+            handles, self._next_frame = self._next_frame, []
+        for handle in handles:
+            handle._fire()
@@ -1,4 +1,5 @@
 from collections.abc import Iterable, Mapping
+from dataclasses import replace
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Annotated, Any, Required, is_typeddict
 from react_tk.props.annotations.shadow_reflector import shadow_reflector
@@ -16,7 +17,9 @@ from react_tk.reflect.reader.type import (
     Reader_Method,
 )
 from react_tk.reflect.accessor.base import KeyAccessor
+from react_tk.reflect.accessor.type import OrigBasesAccessor
 from react_tk.props.annotations.prop_meta import prop_meta, schema_meta, some_meta
+from react_tk.props.annotations.schema_cache import schema_cache
 from react_tk.props.impl.prop import Prop_Any
 import funcy
 
@@ -133,9 +136,66 @@ def _methods_to_props(path: tuple[str, ...], cls: type):
         yield p
 
 
+def _at_path(prop: Prop_Any, path: tuple[str, ...]) -> Prop_Any:
+    match prop:
+        case Prop():
+            return replace(prop, path=path)
+        case Prop_Schema():
+            return Prop_Schema(
+                path=path,
+                name=prop.name,
+                props=[_at_path(p, (*path, prop.name)) for p in prop],
+                diff=prop.diff,
+                computed_name=prop.computed_name,
+                metadata=prop.metadata,
+            )
+
+
+# Props of each TypedDict read so far by key, at an empty path, and the modules
+# they were read from.
+_partials: dict[type, dict[str, Prop_Any]] = {}
+_partial_modules: dict[type, frozenset[str]] = {}
+# Modules read from by each top class being read, innermost last.
+_sources: list[set[str]] = []
+
+
+def _typeddict_props(cls: type) -> dict[str, Prop_Any]:
+    """Props of a TypedDict by key. Each one is read once, and one that extends
+    others reuses their props and only reads the keys it adds or redeclares."""
+    if (cached := _partials.get(cls)) is not None:
+        return cached
+    annotations = cls.__annotations__
+    inherited: dict[str, Prop_Any] = {}
+    modules = {cls.__module__}
+    for base in OrigBasesAccessor(cls).get(()):
+        if is_typeddict(base):
+            base_annotations = base.__annotations__
+            for key, prop in _typeddict_props(base).items():
+                if annotations[key] == base_annotations[key]:
+                    inherited.setdefault(key, prop)
+            modules |= _partial_modules[base]
+    reader = shadow_reflector.type(cls)
+    props: dict[str, Prop_Any] = {}
+    for key in annotations:
+        if key in inherited:
+            props[key] = inherited[key]
+        elif meta := _get_meta_for_prop(annotation := reader.annotation(key)):
+            props[key] = _create((), key, annotation, meta)
+    _partials[cls] = props
+    _partial_modules[cls] = frozenset(modules)
+    return props
+
+
 def _read_props_from_class(path: tuple[str, ...], cls: type):
     if not shadow_reflector.is_supported(cls):
         return ()
+    if is_typeddict(cls):
+        props = _typeddict_props(cls)
+        if _sources:
+            _sources[-1].update(_partial_modules[cls])
+        return tuple(_at_path(p, path) for p in props.values())
+    if _sources:
+        _sources[-1].update(k.__module__ for k in cls.__mro__)
     reader = shadow_reflector.type(cls)
 
     normal_props = _attrs_to_props(path, reader.annotations)
@@ -148,6 +208,20 @@ def _read_props_from_class(path: tuple[str, ...], cls: type):
 
 
 def read_props_from_top_class(cls: type) -> "Prop_Schema":
+    cache = schema_cache()
+    if cache and (schema := cache.load(cls)) is not None:
+        return schema
+    _sources.append(set())
+    try:
+        schema = _read_top_class(cls)
+    finally:
+        modules = _sources.pop()
+    if cache:
+        cache.store(cls, schema, modules)
+    return schema
+
+
+def _read_top_class(cls: type) -> "Prop_Schema":
     name = cls.__name__
     props = [*_read_props_from_class((name,), cls)]
     init_block = funcy.first(x for x in props if x.name == "__init__")
@@ -0,0 +1,158 @@
+import io
+import os
+import sys
+from importlib.util import find_spec
+from logging import getLogger
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+from zlib import crc32
+
+# pickle is imported where it's used, since the cache is opt-in and it'd add to
+# every startup otherwise. Sources are hashed with crc32 for the same reason:
+# zlib is already loaded, hashlib isn't.
+if TYPE_CHECKING:
+    from pickle import Pickler
+
+    from react_tk.props.impl.prop import Prop_Schema
+
+logger = getLogger("react_tk")
+
+ENV_VAR = "REACT_TK_SCHEMA_CACHE"
+
+
+def _mapping_proxy(d: dict[str, Any]) -> MappingProxyType[str, Any]:
+    return MappingProxyType(d)
+
+
+def _pickler(file: io.BytesIO) -> "Pickler":
+    import pickle
+
+    class _Pickler(pickle.Pickler):
+        def reducer_override(self, obj: Any) -> Any:
+            if type(obj) is MappingProxyType:
+                return _mapping_proxy, (dict(obj),)
+            return NotImplemented
+
+    return _Pickler(file, pickle.HIGHEST_PROTOCOL)
+
+
+_source_hashes: dict[str, int | None] = {}
+
+
+def _source_file(module: str) -> str | None:
+    if (loaded := sys.modules.get(module)) is not None:
+        return getattr(loaded, "__file__", None)
+    try:
+        spec = find_spec(module)
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec and spec.has_location else None
+
+
+def _source_hash(module: str) -> int | None:
+    """Hash of the source of *module*, or None if it has none."""
+    if module in _source_hashes:
+        return _source_hashes[module]
+    file = _source_file(module)
+    try:
+        digest = crc32(Path(file).read_bytes()) if file else None
+    except OSError:
+        digest = None
+    _source_hashes[module] = digest
+    return digest
+
+
+_package_hash: int | None = None
+
+
+def _react_tk_hash() -> int:
+    """One hash of every source file of react_tk, since schemas embed types and
+    aliases from all over it."""
+    global _package_hash
+    if _package_hash is None:
+        root = Path(__file__).parents[2]
+        files = []
+        for path, dirs, names in os.walk(root):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            files += [os.path.join(path, n) for n in names if n.endswith(".py")]
+        digest = 0
+        for file in sorted(files):
+            digest = crc32(os.path.relpath(file, root).encode(), digest)
+            digest = crc32(Path(file).read_bytes(), digest)
+        _package_hash = digest
+    return _package_hash
+
+
+class SchemaCache:
+    """Schemas of node classes pickled under *directory*, so a warm start can
+    skip reflecting on their annotations and setters.
+
+    An entry is used only if the Python version, the source of react_tk and the
+    source of every module the schema was read from are unchanged. Anything
+    else an annotation depends on isn't checked, so clear the directory if a
+    type alias moves between modules. Only point it at a directory you trust,
+    since entries are unpickled.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+
+    def _file(self, cls: type) -> Path:
+        return self.directory / f"{cls.__module__}.{cls.__qualname__}.pickle"
+
+    @staticmethod
+    def _key(modules: set[str] | frozenset[str]) -> tuple[Any, ...]:
+        return (
+            sys.version,
+            _react_tk_hash(),
+            tuple(sorted((m, _source_hash(m)) for m in modules)),
+        )
+
+    @staticmethod
+    def is_cacheable(target: type) -> bool:
+        # Classes defined in functions can share a qualname.
+        return "<locals>" not in target.__qualname__
+
+    def load(self, cls: type) -> "Prop_Schema | None":
+        import pickle
+
+        if not self.is_cacheable(cls):
+            return None
+        try:
+            key, modules, data = pickle.loads(self._file(cls).read_bytes())
+            if key != self._key(modules):
+                return None
+            return pickle.loads(data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring cached schema of %s: %r", cls.__qualname__, e)
+            return None
+
+    def store(
+        self, cls: type, schema: "Prop_Schema", modules: set[str] | frozenset[str]
+    ) -> None:
+        import pickle
+
+        if not self.is_cacheable(cls):
+            return
+        try:
+            buffer = io.BytesIO()
+            _pickler(buffer).dump(schema)
+            entry = pickle.dumps(
+                (self._key(modules), frozenset(modules), buffer.getvalue())
+            )
+            self.directory.mkdir(parents=True, exist_ok=True)
+            file = self._file(cls)
+            temp = file.with_suffix(f".{os.getpid()}.tmp")
+            temp.write_bytes(entry)
+            os.replace(temp, file)
+        except Exception as e:
+            logger.debug("Not caching the schema of %s: %r", cls.__qualname__, e)
+
+
+def schema_cache() -> SchemaCache | None:
+    """The cache in the directory named by `REACT_TK_SCHEMA_CACHE`, if it's set."""
+    directory = os.environ.get(ENV_VAR)
+    return SchemaCache(directory) if directory else None
@@ -5,14 +5,22 @@ from expression import Nothing, Some, Option
 from abc import abstractmethod
 from collections.abc import Callable, Iterator, Mapping
 from copy import copy
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from functools import cached_property
 
 # os.truncate was unused; removed to clean imports
 from types import MappingProxyType
-from typing import Any, Iterable, Literal, Self
-
-from typeguard import TypeCheckError, check_type
+from typing import (
+    Any,
+    ForwardRef,
+    Iterable,
+    Literal,
+    NamedTuple,
+    Self,
+    TypeAliasType,
+    get_args,
+    get_origin,
+)
 
 from react_tk.props.impl.common import DiffMode
 from react_tk.util.dict import (
@@ -111,8 +119,49 @@ class Prop_Schema(VMappingBase[str, "Prop_Any"], _Prop_Base):
         """Return a new instance of the same concrete class with the given values."""
         copyed = copy(self)
         copyed._props = self._to_dict(new_props)
+        if "plan" in copyed.__dict__:
+            del copyed.plan
         return copyed
 
+    @cached_property
+    def plan(self) -> "tuple[_ComputeStep, ...]":
+        """The schema flattened into the steps `Prop_Mapping.compute` runs."""
+        steps = []
+        for prop in self:
+            computed_name = prop.computed_name or prop.name
+            match prop:
+                case Prop() as p:
+                    if computed_name in _RESERVED and not p.is_required:
+                        continue
+                    steps.append(
+                        _ComputeStep(
+                            name=p.name,
+                            subsection=p.subsection,
+                            computed_name=(
+                                None if computed_name in _RESERVED else computed_name
+                            ),
+                            converter=p.converter,
+                            default=(
+                                p.no_value.value if p.no_value.is_some() else MISSING
+                            ),
+                            nested=None,
+                        )
+                    )
+                case Prop_Schema() as pb:
+                    if computed_name in _RESERVED:
+                        continue
+                    steps.append(
+                        _ComputeStep(
+                            name=pb.name,
+                            subsection=None,
+                            computed_name=computed_name,
+                            converter=None,
+                            default=MISSING,
+                            nested=pb.plan,
+                        )
+                    )
+        return tuple(steps)
+
     def __iter__(self) -> Iterator["Prop_Any"]:
         return iter(self._props.values())
 
@@ -135,7 +184,7 @@ class Prop_Schema(VMappingBase[str, "Prop_Any"], _Prop_Base):
                     )
                 continue
             prop.assert_valid(input[prop.name])
-        extra_props = set(input.keys()) - {prop.name for prop in self}
+        extra_props = input.keys() - self._props.keys()
         if extra_props:
             joined = ", ".join(extra_props)
             raise ValueError(f"Extra props {joined} in {self.name}")
@@ -159,6 +208,7 @@ class Prop[T](_Prop_Base):
     metadata: Mapping[str, Any] = field(default=MappingProxyType({}))
     computed_name: str | None = field(default=None)
     path: tuple[str, ...]
+    _passed: set[Any] = field(default_factory=set, init=False, repr=False)
 
     def __call__(self, value: MaybeOption[T] = Nothing) -> "Prop_Value[T]":
         return self.to_value(value)
@@ -177,18 +227,54 @@ class Prop[T](_Prop_Base):
             prop=self, value=maybe_normalize(value), old=maybe_normalize(old)
         )
 
+    @cached_property
+    def _checks_by_value(self) -> bool:
+        return _mentions_literal(self.value_type)
+
+    def _check_key(self, input: Any) -> Any:
+        # Scalars of the same type pass or fail together, unless a Literal
+        # is involved, in which case the value itself decides.
+        if type(input) not in _SCALARS:
+            return None
+        if self._checks_by_value:
+            return (type(input), input)
+        return type(input)
+
     def assert_valid(self, input: Any):
+        if input is None and self.is_required:
+            raise ValueError(f"Value for {self.fqn} is required")
+        if self.value_type is None:
+            return
+        key = self._check_key(input)
+        if key is not None and key in self._passed:
+            return
+        if self.value_type is float and isinstance(input, int):
+            input = float(input)  # type: ignore
+        # typeguard is slow to import, so it's only imported once something
+        # is checked.
+        from typeguard import TypeCheckError, check_type
+
         try:
-            if input is None and self.is_required:
-                raise ValueError(f"Value for {self.fqn} is required")
-            if self.value_type is None:
-                return
-            if self.value_type is not None:
-                if self.value_type is float and isinstance(input, int):
-                    input = float(input)  # type: ignore
-                check_type(input, self.value_type)
+            check_type(input, self.value_type)
         except TypeCheckError as e:
             raise ValueError(f"Typecheck failed in {self.fqn}: {e.args[0]}") from e
+        if key is not None:
+            self._passed.add(key)
+
+
+_SCALARS = frozenset({int, float, complex, bool, str, bytes, type(None)})
+
+
+def _mentions_literal(tp: Any, seen: frozenset[int] = frozenset()) -> bool:
+    if id(tp) in seen or isinstance(tp, (str, ForwardRef)):
+        # Can't tell without resolving it, so assume it might.
+        return True
+    seen = seen | {id(tp)}
+    if isinstance(tp, TypeAliasType):
+        return _mentions_literal(tp.__value__, seen)
+    if get_origin(tp) is Literal:
+        return True
+    return any(_mentions_literal(arg, seen) for arg in get_args(tp))
 
 
 def format_value(value: Any) -> str:
@@ -248,6 +334,100 @@ class Prop_Value[T]:
         return Prop_Value(prop=self.prop, value=Some(value), old=self.value)
 
 
+_RESERVED = ("KIDS", "key")
+
+
+def _strip_reserved(d: dict[str, Any]) -> dict[str, Any]:
+    if "KIDS" in d:
+        d = {k: v for k, v in d.items() if k != "KIDS"}
+    if "key" in d:
+        d = {k: v for k, v in d.items() if k != "key"}
+    for k, v in d.items():
+        if isinstance(v, dict):
+            d[k] = _strip_reserved(v)
+    return d
+
+
+class _ComputeStep(NamedTuple):
+    name: str
+    subsection: str | None
+    # None for a required reserved prop, which is checked but not output.
+    computed_name: str | None
+    converter: Converter[Any] | None
+    default: Any
+    nested: "tuple[_ComputeStep, ...] | None"
+
+
+def _step_value(step: _ComputeStep, raw: Any) -> Any:
+    if isinstance(raw, Option):
+        raw = raw.value if raw.is_some() else step.default
+    if raw is MISSING:
+        raise ValueError(f"Value for required prop {step.name} is missing")
+    if step.converter:
+        raw = step.converter(raw)
+    if isinstance(raw, dict):
+        raw = _strip_reserved(raw)
+    return raw
+
+
+def _run_plan(plan: tuple[_ComputeStep, ...], values: KeyedValues) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for step in plan:
+        name, subsection, computed_name, _, _, nested = step
+        if nested is not None:
+            result[computed_name] = _run_plan(nested, values.get(name, {}))  # type: ignore[index]
+            continue
+        v = _step_value(step, values.get(name, Nothing))
+        if computed_name is None:
+            continue
+        if subsection is None:
+            result[computed_name] = v
+        elif subsection in result:
+            result[subsection][computed_name] = v
+        else:
+            result[subsection] = {computed_name: v}
+    return result
+
+
+def _diff_plan(
+    plan: tuple[_ComputeStep, ...], older: KeyedValues, newer: KeyedValues
+) -> dict[str, Any]:
+    """Same as `deep_diff` over both computed mappings, but only computes the
+    props whose raw values differ."""
+    result: dict[str, Any] = {}
+    for step in plan:
+        name, subsection, computed_name, _, default, nested = step
+        if nested is not None:
+            older_nested = older.get(name, {})
+            newer_nested = newer.get(name, {})
+            if older_nested is not newer_nested and (
+                changed := _diff_plan(nested, older_nested, newer_nested)
+            ):
+                result[computed_name] = changed  # type: ignore[index]
+            continue
+        older_raw = older.get(name, Nothing)
+        newer_raw = newer.get(name, Nothing)
+        if older_raw is newer_raw or older_raw == newer_raw:
+            if newer_raw is Nothing and default is MISSING:
+                raise ValueError(f"Value for required prop {name} is missing")
+            continue
+        older_v = _step_value(step, older_raw)
+        newer_v = _step_value(step, newer_raw)
+        if computed_name is None:
+            continue
+        if isinstance(older_v, Mapping) and isinstance(newer_v, Mapping):
+            newer_v = deep_diff(older_v, newer_v)
+            if not newer_v:
+                continue
+        elif older_v == newer_v:
+            continue
+        if subsection is None:
+            result[computed_name] = newer_v
+        else:
+            result.setdefault(subsection, {})[computed_name] = newer_v
+    return result
+
+
 class Prop_Mapping(VMappingBase[str, "SomePropValue"]):
     @property
     def name(self) -> str:
@@ -263,6 +443,10 @@ class Prop_Mapping(VMappingBase[str, "SomePropValue"]):
         self._values = value
         self._old = old
 
+    @property
+    def raw(self) -> KeyedValues:
+        return self._values
+
     def is_valid(self) -> bool:
         return self.prop.is_valid(self._values)
 
@@ -278,25 +462,9 @@ class Prop_Mapping(VMappingBase[str, "SomePropValue"]):
         return self.prop.computed_name or self.prop.name
 
     def compute(self) -> "Prop_ComputedMapping":
-        result = {}
-
-        def _get_or_create_section(name: str | None) -> dict[str, Any]:
-            if name is None:
-                return result
-            if name not in result:
-                result[name] = {}
-
-            return result[name]
-
-        for pv in self:
-            match pv:
-                case Prop_Value() as v:
-                    v_ = v.compute()
-                    section = _get_or_create_section(v.prop.subsection)
-                    section[v.computed_name] = v_
-                case Prop_Mapping() as bv:
-                    result.update({bv.computed_name: bv.compute().values})
-        return Prop_ComputedMapping(values=result, source=self)
+        return Prop_ComputedMapping(
+            values=_run_plan(self.prop.plan, self._values), source=self, stripped=True
+        )
 
     def get_pv(self, key: str) -> Prop_Value[Any]:
         match self[key]:
@@ -377,6 +545,12 @@ class Prop_Mapping(VMappingBase[str, "SomePropValue"]):
     def diff(self, other: "Prop_Mapping | KeyedValues") -> "Prop_ComputedMapping":
         if not isinstance(other, Prop_Mapping):
             other = Prop_Mapping(prop=self.prop, value=other)
+        if other.prop is self.prop:
+            return Prop_ComputedMapping(
+                values=_diff_plan(self.prop.plan, self._values, other._values),
+                source=other,
+                stripped=True,
+            )
         my_computed = self.compute()
         other_computed = other.compute()
         return my_computed.diff(other_computed)
@@ -386,22 +560,14 @@ class Prop_Mapping(VMappingBase[str, "SomePropValue"]):
 class Prop_ComputedMapping:
     values: KeyedValues
     source: Prop_Mapping = field(repr=False)
+    stripped: InitVar[bool] = False
 
     def __getitem__(self, key: str) -> Any:
         return self.values[key]
 
-    def __post_init__(self):
-        def remove_KIDS_recursively(d: dict[str, Any]) -> dict[str, Any]:
-            if "KIDS" in d:
-                d = {k: v for k, v in d.items() if k != "KIDS"}
-            if "key" in d:
-                d = {k: v for k, v in d.items() if k != "key"}
-            for k, v in d.items():
-                if isinstance(v, dict):
-                    d[k] = remove_KIDS_recursively(v)
-            return d
-
-        self.values = remove_KIDS_recursively(self.values)  # type: ignore
+    def __post_init__(self, stripped: bool):
+        if not stripped:
+            self.values = _strip_reserved(self.values)  # type: ignore
 
     def __bool__(self) -> bool:
         return bool(self.values)
@@ -424,7 +590,7 @@ class Prop_ComputedMapping:
         if not isinstance(other, Prop_ComputedMapping):
             other = Prop_ComputedMapping(values=other, source=self.source)
         out = deep_diff(self.values, other.values)
-        return Prop_ComputedMapping(values=out, source=other.source)
+        return Prop_ComputedMapping(values=out, source=other.source, stripped=True)
 
 
 type SomePropValue = "Prop_Value | Prop_Mapping"
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Any, Self, overload
+from typing import Any, ClassVar, Self, overload
 
 from react_tk.util.missing import MISSING
 
@@ -65,10 +65,25 @@ class KeyAccessor[T]:
     @overload
     def get[R](self, other: R, /) -> T | R: ...
     def get(self, other: Any = MISSING, /) -> Any:
-        if not self.has_key:
+        value = getattr(self.target, self.key, MISSING)
+        if value is MISSING:
             if other is MISSING:
                 raise AttributeError(
                     f"{self.target.__class__.__name__} has no {self.key} attribute"
                 )
             return other
-        return self._get()
+        return value
+
+
+class DerivedAccessor[T](KeyAccessor[T]):
+    """A value computed from an object and cached on it.
+
+    Cleared by `clear_derived`, e.g. when a node is cloned or gets a new trace.
+    """
+
+    prefix: ClassVar[str] = "__derived_"
+
+
+def clear_derived(target: object) -> None:
+    for key in [k for k in vars(target) if k.startswith(DerivedAccessor.prefix)]:
+        delattr(target, key)
@@ -15,6 +15,7 @@ from typing import (
     overload,
 )
 
+from react_tk.reflect.accessor.base import KeyAccessor
 from react_tk.renderable.node.shadow_node import NodeProps, ShadowNode
 from react_tk.renderable.renderable_base import RenderableBase
 
@@ -47,6 +48,18 @@ class Component[Node: ShadowNode[Any] = ShadowNode[Any]](RenderableBase):
     def render(self, /) -> "RenderResult[Node]": ...
 
 
+class MemoAccessor(KeyAccessor[bool]):
+    @property
+    def key(self) -> str:
+        return "__react_tk_memo__"
+
+
+def memo[C: type[Component[Any]]](cls: C) -> C:
+    """Skip re-rendering a component while its fields and the ctx keys it read are unchanged."""
+    MemoAccessor(cls).set(True)
+    return cls
+
+
 class is_render_element[T: ShadowNode[Any]]:  # type: ignore
     def __new__(cls, obj: Any) -> TypeIs[RenderElement[T]]:
         return isinstance(obj, (ShadowNode, Component))  # type: ignore
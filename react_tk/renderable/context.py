@@ -1,15 +1,15 @@
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from logging import getLogger
 import threading
 import asyncio
-from typing import Any, Callable, Self
+from typing import Any, Callable, Iterator, Mapping, Self
 
 from expression import Nothing
 
 from react_tk.interaction.scheduler import ScheduleInfo, Scheduler, _bind_schedule
 from react_tk.renderable.component import AbsCtx
 from react_tk.util.core_reflection import get_attr_skip_hook, has_attr_skip_hook
-from react_tk.util.async_loop import create_event_loop
 
 logger = getLogger("react_tk")
 
@@ -36,23 +36,30 @@ class Ctx(Scheduler, AbsCtx):
     _listeners: list[Callable[[Self], None]] = []
     _map: dict[str, Any] = {}
     _frozen: bool = False
+    _read_trackers: list[dict[str, Any]] = []
 
     def __copy__(self) -> "Ctx":
         cls = self.__class__
         result = cls.__new__(cls)
         result.__dict__.update(self.__dict__)
         result._map = self._map.copy()
+        # The copy holds the loop too, so it keeps running if this is released.
+        result._hold_loop()
         return result
 
     def __init__(self, **attrs: Any):
         super().__init__("CtxScheduler")
         self._map = dict[str, Any](attrs)
         self._listeners = []
+        self._read_trackers = []
 
     def __getattr__(self, name: str) -> Any:
         attr = get_attr_skip_hook(self, name, run_get=name == "scheduler")
         if attr is Nothing:
-            return self._map.get(name, None)
+            value = self._map.get(name, None)
+            if self._read_trackers:
+                self._read_trackers[-1].setdefault(name, value)
+            return value
         return attr.value
 
     def __eq__(self, other: object) -> bool:
@@ -72,6 +79,8 @@ class Ctx(Scheduler, AbsCtx):
         if has_attr_skip_hook(self, key):
             return super().__setattr__(key, value)
 
+        if key not in self._map or self._map[key] != value:
+            object.__setattr__(self, "_version", self._version + 1)
         self._map[key] = value
 
     def __call__(self, *args: Any, **kwargs: Any) -> Self:
@@ -97,3 +106,28 @@ def ctx_snapshot(ctx: "Ctx") -> "Ctx":
 
 def ctx_freeze(ctx: "Ctx") -> "CtxLock":
     return CtxLock(ctx)
+
+
+@contextmanager
+def ctx_track_reads(ctx: "Ctx") -> Iterator[dict[str, Any]]:
+    """Record the context attributes read inside the block, with the values seen."""
+    reads: dict[str, Any] = {}
+    ctx._read_trackers.append(reads)
+    try:
+        yield reads
+    finally:
+        ctx._read_trackers.pop()
+        ctx_record_reads(ctx, reads)
+
+
+def ctx_record_reads(ctx: "Ctx", reads: Mapping[str, Any]) -> None:
+    """Report reads to the enclosing tracker, as if they had just happened."""
+    if not ctx._read_trackers:
+        return
+    outer = ctx._read_trackers[-1]
+    for k, v in reads.items():
+        outer.setdefault(k, v)
+
+
+def ctx_reads_changed(ctx: "Ctx", reads: Mapping[str, Any]) -> bool:
+    return any(ctx._map.get(k, None) != v for k, v in reads.items())
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
-from copy import copy
 from dataclasses import dataclass, is_dataclass
 from inspect import isabstract
 from pyclbr import Class
@@ -33,6 +32,7 @@ from react_tk.renderable.trace import (
     RenderTrace,
     RenderTraceAccessor,
 )
+from react_tk.reflect.accessor.base import DerivedAccessor, clear_derived
 from react_tk.props.annotations.prop_meta import prop_meta
 from react_tk.props.annotations.decorators import HasChildren, prop_getter
 from react_tk.props.annotations.create_props import (
@@ -56,10 +56,11 @@ class HasPropsSchema:
         PropsAccessor(cls).set(props_block)
 
     def __merge__(self, input_values: KeyedValues = {}, **kwargs: Any) -> Self:
-        input_values = {
-            **input_values,
-            **kwargs,
-        }
+        if kwargs:
+            input_values = {
+                **input_values,
+                **kwargs,
+            }
         schema = PropsAccessor(self).get()
         values = PropValuesAccessor(self)
         if not values:
@@ -67,7 +68,11 @@ class HasPropsSchema:
             values = pbv
         else:
             values = values.get().merge(input_values)
-        clone = copy(self)
+        # Not `copy()`: that goes through `__reduce_ex__` and `__new__`, which
+        # would capture a construct trace only to overwrite it.
+        clone = object.__new__(type(self))
+        vars(clone).update(vars(self))
+        clear_derived(clone)
         PropValuesAccessor(clone).set(values)
         return clone
 
@@ -77,6 +82,12 @@ class NodeProps(TypedDict):
     KIDS: Annotated[NotRequired[Iterable[Any]], prop_meta(no_value=(), diff="never")]
 
 
+class InfoAccessor(DerivedAccessor["ShadowNodeInfo"]):
+    @property
+    def key(self) -> str:
+        return "__derived_info__"
+
+
 @dataclass
 class ShadowNodeInfo:
     class_name: str
@@ -131,8 +142,12 @@ class ShadowNode[Kids: ShadowNode[Any] = Never](
 
     @property
     def __info__(self) -> ShadowNodeInfo:
-        return ShadowNodeInfo.from_node(self)
+        accessor = InfoAccessor(self)
+        if cached := accessor.get(None):
+            return cached
+        info = ShadowNodeInfo.from_node(self)
+        accessor.set(info)
+        return info
 
     def __str__(self) -> str:
-        info = ShadowNodeInfo.from_node(self)
-        return f"{info.short_id}"
+        return f"{self.__info__.short_id}"
@@ -4,7 +4,7 @@ from types import FrameType
 from typing import TYPE_CHECKING, Any, Literal
 from inspect import getframeinfo, stack, FrameInfo, currentframe
 
-from react_tk.reflect.accessor.base import KeyAccessor
+from react_tk.reflect.accessor.base import KeyAccessor, clear_derived
 from react_tk.util.stack import ReactTkFrameInfo
 from react_tk.util.str import format_subscript
 
@@ -86,51 +86,103 @@ class SequencedRenderFrame(RenderFrame):
 
 
 class RenderTrace:
-    frames: tuple[SequencedRenderFrame, ...]
+    """The path of render frames from the root down to a node.
+
+    Traces are linked: each holds its parent and its last frame, so extending
+    one is a single allocation that shares everything above it. The hash and
+    string forms are built from the parent's, which are computed once.
+    """
+
+    parent: "RenderTrace | None"
+    top: SequencedRenderFrame | None
+    depth: int
+    _strings: dict[Display, str]
+    _hash: int
+    _frames: tuple[SequencedRenderFrame, ...] | None
 
     def __init__(self, *frames: SequencedRenderFrame):
-        self.frames = frames
+        parent = None
+        if frames:
+            parent = RenderTrace()
+            for frame in frames[:-1]:
+                parent = parent._extend(frame)
+        self._link(parent, frames[-1] if frames else None)
+
+    def _link(
+        self, parent: "RenderTrace | None", frame: SequencedRenderFrame | None
+    ) -> None:
+        self.parent = parent
+        self.top = frame
+        self.depth = parent.depth + 1 if parent else 0
+        self._hash = hash((parent._hash, frame)) if parent else hash(())
+        self._strings = {}
+        self._frames = None
+
+    def _extend(self, frame: SequencedRenderFrame) -> "RenderTrace":
+        child = object.__new__(RenderTrace)
+        child._link(self, frame)
+        return child
+
+    @property
+    def frames(self) -> tuple[SequencedRenderFrame, ...]:
+        if self._frames is None:
+            self._frames = (
+                (*self.parent.frames, self.top) if self.parent and self.top else ()
+            )
+        return self._frames
 
     def __add__(self, other: "RenderTrace | SequencedRenderFrame") -> "RenderTrace":
         if isinstance(other, RenderFrame):
-            return RenderTrace(*self.frames, other)
-        return RenderTrace(*self.frames, *other.frames)
+            return self._extend(other)
+        result = self
+        for frame in other.frames:
+            result = result._extend(frame)
+        return result
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, RenderTrace):
             return NotImplemented
-        return self.frames == value.frames
+        a, b = self, value
+        while a is not b:
+            if a is None or b is None:
+                return False
+            if a._hash != b._hash or a.depth != b.depth or a.top != b.top:
+                return False
+            a, b = a.parent, b.parent
+        return True
 
     def __hash__(self) -> int:
-        return hash(self.frames)
-
-    @property
-    def top(self) -> RenderFrame | None:
-        if not self.frames:
-            return None
-        return self.frames[-1]
+        return self._hash
 
     def to_string(self, display: Display) -> str:
-        frames = self.frames
-        if display == "short-id":
-            frames = self.frames[-1:]
-            display = "id"
-        parts = [frame.to_string(display) for frame in frames]
-        result = ""
-        for part in parts:
-            if result and not starts_with_non_breaking.search(part):
-                result += render_delim if display != "safe" else "__"
-
-            result += part
-
+        if (cached := self._strings.get(display)) is not None:
+            return cached
+        result = self._to_string(display)
+        self._strings[display] = result
         return result
 
+    def _to_string(self, display: Display) -> str:
+        if not self.top:
+            return ""
+        if display == "short-id":
+            return self.top.to_string("id")
+        part = self.top.to_string(display)
+        result = self.parent.to_string(display) if self.parent else ""
+        if result and not starts_with_non_breaking.search(part):
+            result += render_delim if display != "safe" else "__"
+        return result + part
+
 
 class RenderTraceAccessor(KeyAccessor[RenderTrace]):
     @property
     def key(self) -> str:
         return "_TRACE"
 
+    def set(self, value: RenderTrace) -> None:
+        # Node info and ids are derived from the trace.
+        clear_derived(self.target)
+        super().set(value)
+
 
 class ConstructTraceAccessor(KeyAccessor[ReactTkFrameInfo]):
     @property
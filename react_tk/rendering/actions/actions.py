@@ -191,3 +191,18 @@ type ReconcileAction[Res = Misc] = Place[Res] | Unplace[Res] | Update[Res] | Rep
 
 type SubAction[Res = Misc] = Create[Res] | Update[Res]
 type Compat = Literal["update", "switch", "place"]
+
+
+class ActionLogLine:
+    """The log line of a reconciled action. It's formatted only if a handler
+    emits it, since that walks the whole diff."""
+
+    __slots__ = ("action",)
+
+    def __init__(self, action: ReconcileAction[Any]) -> None:
+        self.action = action
+
+    def __str__(self) -> str:
+        if self.action:
+            return f"⚖️  RECONCILE {self.action}"
+        return f"🚫 RECONCILE {self.action.key} "
@@ -0,0 +1,54 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Iterable, Iterator
+
+from react_tk.rendering.actions.actions import ReconcileAction
+from react_tk.rendering.actions.node_reconciler import (
+    ReconcilerAccessor,
+    ReconcilerBase,
+)
+from react_tk.rendering.actions.reconcile_state import TransientReconcileState
+from react_tk.rendering.hooks import count_actions
+
+
+@dataclass
+class CommitBatch:
+    domain: type[ReconcilerBase[Any]]
+    actions: list[ReconcileAction[Any]] = field(default_factory=list)
+    duration: float = field(default=0.0)
+
+    @property
+    def size(self) -> int:
+        return len(self.actions)
+
+    @property
+    def counts(self) -> Counter[str]:
+        return count_actions(self.actions)
+
+    def run(self, state: TransientReconcileState) -> None:
+        started = perf_counter()
+        self.domain.run_batch(state, self.actions)
+        self.duration = perf_counter() - started
+
+    def __str__(self) -> str:
+        return (
+            f"📦 {self.domain.__name__} × {self.size} in {self.duration * 1000:.2f}ms"
+        )
+
+
+def group_batches(
+    actions: Iterable[ReconcileAction[Any]],
+) -> Iterator[CommitBatch]:
+    # Actions arrive depth-first, so a run of actions sharing a domain never
+    # spans two windows: each window's subtree is preceded by its own action.
+    current: CommitBatch | None = None
+    for action in actions:
+        domain = ReconcilerAccessor(action.node).get().batch_domain()
+        if not current or current.domain is not domain:
+            if current:
+                yield current
+            current = CommitBatch(domain)
+        current.actions.append(action)
+    if current:
+        yield current
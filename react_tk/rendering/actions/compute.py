@@ -1,14 +1,20 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 from sre_constants import ANY
 from typing import (
     Any,
     Iterable,
+    Sequence,
 )
 
 from react_tk.renderable.component import Component
 from react_tk.renderable.node.prop_value_accessor import PropValuesAccessor
 from react_tk.props.impl.prop import Prop
+from react_tk.rendering.actions.fingerprint import (
+    SubtreeComparer,
+    kids_of,
+    subtree_ids,
+)
 from react_tk.rendering.actions.node_reconciler import Compat
 from react_tk.rendering.actions.reconcile_state import (
     PersistentReconcileState,
@@ -26,10 +32,9 @@ from .actions import (
     Place,
 )
 from react_tk.renderable.node.shadow_node import ShadowNode
+from react_tk.util.seq import longest_increasing_subsequence
 
 
-from itertools import groupby, zip_longest
-
 logger = logging.getLogger("react_tk")
 type AnyNode = ShadowNode[ShadowNode[Any]]
 
@@ -100,67 +105,120 @@ class _ComputeAction:
                 raise ValueError(f"Unknown compatibility: {compat}")
 
 
+@dataclass
+class _KidsDiff:
+    """How a parent's existing children line up with its new ones.
+
+    Children are matched by identity. Of the matched ones, those on a longest
+    increasing run of old positions stay where they are and everything else
+    moves, which is the fewest moves that produce the new order.
+    """
+
+    # Per new position, the existing child with the same identity.
+    kept: list[RenderedNode[Any] | None]
+    # New positions of kept children that don't need to move.
+    stable: set[int]
+    # Per new position, an unmatched existing child that was at that position
+    # and is taking the new child's place.
+    paired: dict[int, RenderedNode[Any]]
+    # Unmatched existing children with nothing taking their place.
+    removed: list[RenderedNode[Any]]
+
+    @classmethod
+    def create(
+        cls, existing: list[tuple[int, RenderedNode[Any]]], ids: list[int]
+    ) -> "_KidsDiff":
+        old_positions = {id: pos for pos, (id, _) in enumerate(existing)}
+        kept: list[RenderedNode[Any] | None] = []
+        kept_at: list[int] = []
+        kept_from: list[int] = []
+        for at, id in enumerate(ids):
+            pos = old_positions.pop(id, None)
+            if pos is None:
+                kept.append(None)
+                continue
+            kept.append(existing[pos][1])
+            kept_at.append(at)
+            kept_from.append(pos)
+        stable = {kept_at[i] for i in longest_increasing_subsequence(kept_from)}
+        paired: dict[int, RenderedNode[Any]] = {}
+        removed: list[RenderedNode[Any]] = []
+        for pos in old_positions.values():
+            if pos < len(kept) and kept[pos] is None:
+                paired[pos] = existing[pos][1]
+            else:
+                removed.append(existing[pos][1])
+        return cls(kept=kept, stable=stable, paired=paired, removed=removed)
+
+
 @dataclass
 class ComputeTreeActions:
     state: TransientReconcileState
+    _is_same_subtree: SubtreeComparer = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._is_same_subtree = SubtreeComparer(self.state.ids)
 
     @staticmethod
-    def _check_duplicates(rendering: Iterable[ShadowNode]):
-        key_to_nodes = {
-            key: list(group)
-            for key, group in groupby(rendering, key=lambda x: x.__info__.uid)
-        }
-        messages = {
-            key: f"Duplicates for {key} found: {group} "
-            for key, group in key_to_nodes.items()
-            if len(group) > 1
-        }
-        if messages:
-            raise ValueError(messages)
-
-    def _existing_children(self, parent: AnyNode) -> Iterable[RenderedNode[Any]]:
-        existing_parent = self.state.existing_resources.get(parent.__info__.uid)
+    def _check_duplicates(kids: Sequence[ShadowNode], ids: list[int]):
+        if len(set(ids)) == len(ids):
+            return
+        id_to_nodes: dict[int, list[ShadowNode]] = {}
+        for id, node in zip(ids, kids):
+            id_to_nodes.setdefault(id, []).append(node)
+        messages = {}
+        for group in id_to_nodes.values():
+            if len(group) > 1:
+                uid = group[0].__info__.uid
+                messages[uid] = f"Duplicates for {uid} found: {group} "
+        raise ValueError(messages)
+
+    def _existing_children(
+        self, parent: AnyNode
+    ) -> Iterable[tuple[int, RenderedNode[Any]]]:
+        existing_parent = self.state.get(parent)
         if not existing_parent:
             return
-        for child in existing_parent.node.KIDS:
-            if child.__info__.uid not in self.state.being_placed:
-                existing_child = self.state.existing_resources.get(child.__info__.uid)
+        for child in kids_of(existing_parent.node):
+            id = self.state.id_of(child)
+            if id not in self.state.being_placed:
+                existing_child = self.state.existing_resources.get(id)
                 if existing_child:
-                    yield existing_child
+                    yield id, existing_child
 
     def compute_actions(
         self, parent: AnyNode, is_creating_new=False
     ) -> Iterable["ReconcileAction"]:
-        self._check_duplicates(parent.KIDS)
-        existing_children = [*self._existing_children(parent)]
-        pos = -1
-        for prev, next in zip_longest(existing_children, parent.KIDS, fillvalue=None):
-            if is_creating_new:
-                prev = None
-            pos += 1
-            if not next and prev and prev.node.__info__.uid in self.state.being_placed:
-                # if the prev node has gone somewhere else, it's already been unplaced
-                # from its node-based position.
-                continue
-            if next:
-                self.state.being_placed.add(next.__info__.uid)
-            prev_resource = (
-                self.state.existing_resources.get(prev.node.__info__.uid)
-                if prev
-                else None
-            )
-            old_next_rendered = (
-                self.state.existing_resources.get(next.__info__.uid) if next else None
-            )
+        kids = kids_of(parent)
+        ids = [self.state.id_of(kid) for kid in kids]
+        self._check_duplicates(kids, ids)
+        existing = [] if is_creating_new else [*self._existing_children(parent)]
+        diff = _KidsDiff.create(existing, ids)
+        # Removals go first, so that every placement below only has to be
+        # positioned relative to the sibling before it.
+        for prev in diff.removed:
+            yield Unplace(prev)
+        for at, (next, id) in enumerate(zip(kids, ids)):
+            kept = diff.kept[at]
+            stays = at in diff.stable
+            if kept and self._is_same_subtree(kept.node, next):
+                # Same node with the same props all the way down. If it stays
+                # put, there's nothing to do for it or anything under it.
+                if stays:
+                    self.state.being_placed.update(
+                        subtree_ids(kept.node, self.state.ids)
+                    )
+                    continue
+            self.state.being_placed.add(id)
             action = _ComputeAction(
-                prev=prev_resource or prev,
+                prev=kept if stays else diff.paired.get(at),
                 next=next,
-                old_next_rendered=old_next_rendered,
-                at=pos,
+                old_next_rendered=kept or self.state.get(next),
+                at=at,
                 container=parent,
             ).compute()
             yield action
-            if next and next.KIDS:
+            if kids_of(next):
                 yield from self.compute_actions(
                     next,
                     is_creating_new=action.is_creating_new or is_creating_new,
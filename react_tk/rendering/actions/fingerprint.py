@@ -0,0 +1,97 @@
+from typing import Any
+
+from react_tk.reflect.accessor.base import DerivedAccessor
+from react_tk.renderable.node.prop_value_accessor import PropValuesAccessor
+from react_tk.renderable.node.shadow_node import ShadowNode
+from react_tk.rendering.actions.reconcile_state import TraceIds
+
+type ShallowKey = tuple[type, dict[str, Any], tuple[ShadowNode[Any], ...]]
+
+
+class ShallowKeyAccessor(DerivedAccessor[ShallowKey]):
+    @property
+    def key(self) -> str:
+        return "__derived_shallow_key__"
+
+
+class KidsAccessor(DerivedAccessor[tuple[ShadowNode[Any], ...]]):
+    @property
+    def key(self) -> str:
+        return "__derived_kids__"
+
+
+class SubtreeIdsAccessor(DerivedAccessor[tuple[TraceIds, int, frozenset[int]]]):
+    @property
+    def key(self) -> str:
+        return "__derived_subtree_ids__"
+
+
+def kids_of(node: ShadowNode[Any]) -> tuple[ShadowNode[Any], ...]:
+    """The node's KIDS, read through the prop getter once and then cached."""
+    accessor = KidsAccessor(node)
+    cached = accessor.get(None)
+    if cached is None:
+        cached = tuple(node.KIDS)
+        accessor.set(cached)
+    return cached
+
+
+def shallow_key(node: ShadowNode[Any]) -> ShallowKey:
+    """A rendered node's type, its raw prop values other than KIDS, and its
+    kids. Cached on the node, so each node's props and kids are read once."""
+    accessor = ShallowKeyAccessor(node)
+    if cached := accessor.get(None):
+        return cached
+    values = PropValuesAccessor(node).get().raw
+    result = (
+        type(node),
+        {k: v for k, v in values.items() if k != "KIDS"},
+        kids_of(node),
+    )
+    accessor.set(result)
+    return result
+
+
+def subtree_ids(node: ShadowNode[Any], ids: TraceIds) -> frozenset[int]:
+    accessor = SubtreeIdsAccessor(node)
+    cached = accessor.get(None)
+    if cached and cached[0] is ids and cached[1] == ids.released:
+        return cached[2]
+    result = frozenset((ids.of(node),)).union(
+        *(subtree_ids(kid, ids) for kid in kids_of(node))
+    )
+    accessor.set((ids, ids.released, result))
+    return result
+
+
+class SubtreeComparer:
+    """Compares an existing subtree with the one rendered in its place.
+
+    Two subtrees are the same if they produce no actions when one replaces the
+    other. Each pair of nodes is compared once, by its shallow key and the
+    trace ids of its kids, so comparing at every level of the tree stays
+    linear. Lives for one frame, since it keys on the nodes' ids.
+    """
+
+    def __init__(self, ids: TraceIds) -> None:
+        self.ids = ids
+        self._same: dict[tuple[int, int], bool] = {}
+
+    def __call__(self, older: ShadowNode[Any], newer: ShadowNode[Any]) -> bool:
+        if older is newer:
+            return True
+        pair = (id(older), id(newer))
+        if (same := self._same.get(pair)) is not None:
+            return same
+        older_type, older_props, older_kids = shallow_key(older)
+        newer_type, newer_props, newer_kids = shallow_key(newer)
+        of = self.ids.of
+        same = (
+            older_type is newer_type
+            and len(older_kids) == len(newer_kids)
+            and older_props == newer_props
+            and all(of(o) == of(n) for o, n in zip(older_kids, newer_kids))
+            and all(self(o, n) for o, n in zip(older_kids, newer_kids))
+        )
+        self._same[pair] = same
+        return same
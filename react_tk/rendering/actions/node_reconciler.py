@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from logging import getLogger
+from time import perf_counter
 from typing import Any, Literal
 
 from react_tk.reflect.accessor.base import KeyAccessor
@@ -19,11 +20,12 @@ from react_tk.rendering.actions.reconcile_state import (
     RenderedNode,
     TransientReconcileState,
 )
+from react_tk.rendering.hooks import ActionRun
 
 type AnyNode = ShadowNode[ShadowNode[Any]]
 
 
-from typing import Callable, Iterable, Protocol
+from typing import Callable, Iterable, Protocol, Sequence
 
 logger = getLogger("react_tk")
 
@@ -34,9 +36,22 @@ class ReconcilerBase[Res](ABC):
 
     def _register(self, node: AnyNode, resource: Res) -> RenderedNode[Res]:
         rendered = RenderedNode(resource, node)
-        self.state.existing_resources[node.__info__.uid] = rendered
+        self.state.register(rendered)
         return rendered
 
+    def _previous_sibling(self, container: AnyNode, at: int) -> RenderedNode | None:
+        """The rendered node just before position *at* in *container*.
+
+        Children are placed in order, so by the time one is placed, the sibling
+        before it is already where it belongs.
+        """
+        if at <= 0:
+            return None
+        kids = container.KIDS
+        if not isinstance(kids, Sequence):
+            kids = tuple(kids)
+        return self.state.get(kids[at - 1])
+
     @classmethod
     @abstractmethod
     def get_compatibility(cls, older: RenderedNode[Res], newer: AnyNode) -> Compat: ...
@@ -48,6 +63,43 @@ class ReconcilerBase[Res](ABC):
     @abstractmethod
     def run_action(self, action: ReconcileAction[Res]) -> None: ...
 
+    def evict(self, rendered: RenderedNode[Res]) -> None:
+        """Destroys the resource of a node that's been unplaced for too long.
+        Its reconcile state is already gone."""
+
+    @classmethod
+    def batch_domain(cls) -> "type[ReconcilerBase[Any]]":
+        """Consecutive actions whose reconcilers share a domain are committed together."""
+        return cls
+
+    @classmethod
+    def run_batch(
+        cls, state: TransientReconcileState, actions: Sequence[ReconcileAction[Res]]
+    ) -> None:
+        def run(action: ReconcileAction[Res]) -> None:
+            Reconciler = ReconcilerAccessor(action.node).get()
+            Reconciler.create(state).run_action(action)
+
+        run_actions(state, actions, run)
+
+
+def run_actions[Res](
+    state: TransientReconcileState,
+    actions: Sequence[ReconcileAction[Res]],
+    run: Callable[[ReconcileAction[Res]], Any],
+) -> None:
+    """Runs *actions* in order, timing each one if the `on_action` hook has
+    listeners."""
+    on_action = state.hooks.on_action if state.hooks else None
+    if not on_action:
+        for action in actions:
+            run(action)
+        return
+    for action in actions:
+        started = perf_counter()
+        run(action)
+        on_action(ActionRun(action, perf_counter() - started))
+
 
 class ReconcilerAccessor(KeyAccessor[type[ReconcilerBase]]):
     @property
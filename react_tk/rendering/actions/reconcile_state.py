@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from react_tk.reflect.accessor.base import DerivedAccessor
 from react_tk.renderable.node.prop_value_accessor import PropValuesAccessor
 from react_tk.renderable.node.shadow_node import ShadowNode, ShadowNodeInfo
 from react_tk.renderable.trace import RenderTrace, RenderTraceAccessor
@@ -8,6 +9,7 @@ from react_tk.tk.widget_data import WidgetNode
 
 if TYPE_CHECKING:
     from react_tk.rendering.actions.compute import AnyNode
+    from react_tk.rendering.hooks import RenderHooks
 
 
 @dataclass
@@ -34,38 +36,152 @@ class RenderedNode[Res]:
         return self
 
 
+class TraceIds:
+    """Interns the uids of rendered nodes as small ints, for keying reconcile
+    state.
+
+    A uid is the id form of a node's render trace: a keyed frame contributes
+    only its key and an unkeyed one its position, so keyed nodes keep their id
+    wherever they're constructed. Lives as long as the reconcile state that
+    owns it. Released ids are handed out again, so ids cached on nodes are only
+    trusted while `released` hasn't changed.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._uids: list[str | None] = []
+        self._free: list[int] = []
+        self.released = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __call__(self, uid: str) -> int:
+        id = self._ids.get(uid)
+        if id is None:
+            if self._free:
+                id = self._free.pop()
+                self._uids[id] = uid
+            else:
+                id = len(self._uids)
+                self._uids.append(uid)
+            self._ids[uid] = id
+        return id
+
+    def uid(self, id: int) -> str:
+        uid = self._uids[id]
+        if uid is None:
+            raise KeyError(f"Id {id} was released")
+        return uid
+
+    def release(self, id: int) -> None:
+        if (uid := self._uids[id]) is not None:
+            del self._ids[uid]
+            self._uids[id] = None
+            self._free.append(id)
+            self.released += 1
+
+    def of(self, node: ShadowNode[Any]) -> int:
+        accessor = TraceIdAccessor(node)
+        cached = accessor.get(None)
+        if cached and cached[0] is self and cached[1] == self.released:
+            return cached[2]
+        id = self(node.__info__.uid)
+        accessor.set((self, self.released, id))
+        return id
+
+
+class TraceIdAccessor(DerivedAccessor[tuple[TraceIds, int, int]]):
+    @property
+    def key(self) -> str:
+        return "__derived_trace_id__"
+
+
+def same_identity(older: ShadowNode[Any], newer: ShadowNode[Any]) -> bool:
+    """Whether two nodes have the same uid. Compares the ids they were interned
+    as when both have one from the same table, and the uids otherwise."""
+    a = TraceIdAccessor(older).get(None)
+    b = TraceIdAccessor(newer).get(None)
+    if a and b and a[0] is b[0] and a[1] == b[1]:
+        return a[2] == b[2]
+    return older.__info__.uid == newer.__info__.uid
+
+
 @dataclass
 class PersistentReconcileState:
-    existing_resources: dict[str, RenderedNode] = field(default_factory=dict)
-    placed_last: set[str] = field(default_factory=set)
+    existing_resources: dict[int, RenderedNode] = field(default_factory=dict)
+    placed_last: set[int] = field(default_factory=set)
+    ids: TraceIds = field(default_factory=TraceIds)
+    generation: int = field(default=0)
+    # Ids that stopped being placed, oldest first, with the generation they
+    # were last placed in.
+    unplaced_since: dict[int, int] = field(default_factory=dict)
+    evicted: int = field(default=0)
+
+    def id_of(self, node: ShadowNode[Any]) -> int:
+        return self.ids.of(node)
 
     def overwrite(self, rendered: RenderedNode) -> None:
-        self.existing_resources[rendered.node.__info__.uid] = rendered
-        self.placed_last.add(rendered.node.__info__.uid)
+        id = self.id_of(rendered.node)
+        self.existing_resources[id] = rendered
+        self.placed_last.add(id)
+
+    def register(self, rendered: RenderedNode) -> None:
+        self.existing_resources[self.id_of(rendered.node)] = rendered
 
     def was_last_placed(self, node: ShadowNode[Any]) -> bool:
-        return node.__info__.uid in self.placed_last
+        return self.id_of(node) in self.placed_last
 
     def new_transient(self) -> "TransientReconcileState":
         return TransientReconcileState(
             existing_resources=self.existing_resources,
             placed_last=self.placed_last,
+            ids=self.ids,
         )
 
     def from_transient(self, transient: "TransientReconcileState") -> None:
         self.existing_resources = transient.existing_resources
-        self.placed_last = transient.being_placed
+        placed = transient.being_placed
+        for id in self.placed_last - placed:
+            self.unplaced_since[id] = self.generation
+        for id in self.unplaced_since.keys() & placed:
+            del self.unplaced_since[id]
+        self.placed_last = placed
+        self.generation += 1
+
+    def evict(self, after: int) -> list[RenderedNode]:
+        """Forgets the entries that haven't been placed for *after* renders,
+        and returns them so their resources can be destroyed."""
+        cutoff = self.generation - after
+        expired: list[int] = []
+        for id, since in self.unplaced_since.items():
+            if since > cutoff:
+                break
+            expired.append(id)
+        evicted: list[RenderedNode] = []
+        for id in expired:
+            del self.unplaced_since[id]
+            if (rendered := self.existing_resources.pop(id, None)) is not None:
+                evicted.append(rendered)
+            self.ids.release(id)
+        self.evicted += len(evicted)
+        return evicted
 
     def __getitem__(self, node: ShadowNode[Any]) -> RenderedNode:
-        return self.existing_resources[node.__info__.uid]
+        return self.existing_resources[self.id_of(node)]
 
     def get(self, node: ShadowNode[Any]) -> RenderedNode | None:
-        return self.existing_resources.get(node.__info__.uid, None)
+        return self.existing_resources.get(self.id_of(node), None)
 
 
 @dataclass
 class TransientReconcileState(PersistentReconcileState):
-    being_placed: set[str] = field(default_factory=set)
+    being_placed: set[int] = field(default_factory=set)
+    hooks: "RenderHooks | None" = field(default=None)
+
+    def overwrite(self, rendered: RenderedNode) -> None:
+        super().overwrite(rendered)
+        self.being_placed.add(self.id_of(rendered.node))
 
     def will_be_placed(self, node: ShadowNode[Any]) -> bool:
-        return node.__info__.uid in self.being_placed
+        return self.id_of(node) in self.being_placed
@@ -1,7 +1,9 @@
 from collections import defaultdict
 from dataclasses import dataclass, field
 from inspect import FrameInfo
+from logging import getLogger
 import sys
+from time import perf_counter
 from typing import Any, Callable, ClassVar, Generator, Iterable, Optional
 
 from react_tk.renderable.node.shadow_node import ShadowNode
@@ -13,6 +15,7 @@ from react_tk.renderable.trace import RenderTrace, RenderTraceAccessor
 from react_tk.rendering.actions.actions import (
     ReconcileAction,
 )
+from react_tk.rendering.actions.commit_batch import CommitBatch, group_batches
 from react_tk.rendering.actions.compute import (
     AnyNode,
     ComputeTreeActions,
@@ -27,6 +30,9 @@ from react_tk.rendering.actions.reconcile_state import (
     TransientReconcileState,
 )
 from react_tk.renderable.component import Component
+from react_tk.rendering.hooks import ActionsComputed, RenderHooks, count_actions
+
+logger = getLogger("react_tk")
 
 
 def _with_trace(node: ShadowNode[Any], trace: RenderTrace) -> ShadowNode[Any]:
@@ -38,24 +44,50 @@ class RootReconciler[Node: ShadowNode[Any] = ShadowNode[Any]]:
     state: PersistentReconcileState = field(
         default_factory=lambda: PersistentReconcileState(existing_resources={})
     )
+    # How many renders a resource can go unplaced before it's destroyed.
+    evict_after: int | None = field(default=None)
+    hooks: RenderHooks | None = field(default=None)
 
     def _compute_actions(self, transient_state: TransientReconcileState, root):
         for x in ComputeTreeActions(transient_state).compute_actions(root):
             yield x
 
-    def reconcile(self, nodes: tuple[ShadowNode[Any], ...]):
+    def reconcile(self, nodes: tuple[ShadowNode[Any], ...]) -> list[CommitBatch]:
         top_level_fake = TopLevelNode(KIDS=nodes, key="top")
 
+        hooks = self.hooks
         transient_state = self.state.new_transient()
+        transient_state.hooks = hooks
+        started = perf_counter()
         actions = [*self._compute_actions(transient_state, top_level_fake)]
-        self.state.overwrite(RenderedNode(object(), top_level_fake))
-
-        for action in actions:
-            Reconciler = ReconcilerAccessor(action.node).get()
-            reconciler = Reconciler.create(transient_state)
-            if not reconciler:
-                raise ValueError(
-                    f"No reconciler found for action type {type(action.node)}"
-                )
-            reconciler.run_action(action)
+        if hooks and hooks.on_compute_actions:
+            hooks.on_compute_actions(
+                ActionsComputed(perf_counter() - started, count_actions(actions))
+            )
+        transient_state.overwrite(RenderedNode(object(), top_level_fake))
+
+        batches = [*group_batches(actions)]
+        for batch in batches:
+            batch.run(transient_state)
+            logger.info("%s", batch)
+            if hooks and hooks.on_commit_batch:
+                hooks.on_commit_batch(batch)
         self.state.from_transient(transient_state)
+        if self.evict_after is not None:
+            evict_unplaced(self.state, self.evict_after)
+        return batches
+
+
+def evict_unplaced(state: PersistentReconcileState, after: int) -> None:
+    """Destroys the resources that haven't been placed for *after* renders."""
+    evicted = state.evict(after)
+    if not evicted:
+        return
+    transient = state.new_transient()
+    # Deepest first, so nothing is destroyed along with its container before
+    # its own reconciler gets to it.
+    for rendered in sorted(evicted, key=lambda r: r.TRACE.depth, reverse=True):
+        ReconcilerAccessor(rendered.node).get().create(transient).evict(rendered)
+    logger.debug(
+        "🗑️  Evicted %d, %d resident", len(evicted), len(state.existing_resources)
+    )
@@ -0,0 +1,93 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any
+
+from react_tk.renderable.component import Component, MemoAccessor
+from react_tk.renderable.context import Ctx, ctx_reads_changed
+from react_tk.renderable.node.shadow_node import ShadowNode
+from react_tk.renderable.trace import RenderTrace
+
+
+def is_memo(component: Component[Any]) -> bool:
+    return MemoAccessor(component).get(False) and is_dataclass(component)
+
+
+def component_fields(component: Component[Any]) -> tuple[Any, ...]:
+    return tuple(
+        getattr(component, f.name) for f in fields(component) if f.name != "ctx"
+    )
+
+
+@dataclass
+class MemoEntry:
+    fields: tuple[Any, ...]
+    reads: dict[str, Any]
+    result: tuple[ShadowNode[Any], ...] = field(default=())
+    nested: list[RenderTrace] = field(default_factory=list)
+
+
+class MemoCache:
+    """Render results of memo components, keyed by render trace.
+
+    Entries live for one render: whatever wasn't reused or re-rendered is
+    dropped when the next render commits.
+    """
+
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        self._entries: dict[RenderTrace, MemoEntry] = {}
+        self._next: dict[RenderTrace, MemoEntry] = {}
+        self._rendering: list[list[RenderTrace]] = []
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def begin(self) -> None:
+        self._next = {}
+        self._rendering = []
+
+    def commit(self) -> None:
+        self._entries = self._next
+        self._next = {}
+
+    def _keep(self, trace: RenderTrace, entry: MemoEntry) -> None:
+        self._next[trace] = entry
+        if self._rendering:
+            self._rendering[-1].append(trace)
+
+    def lookup(
+        self, trace: RenderTrace, component: Component[Any], ctx: Ctx
+    ) -> MemoEntry | None:
+        entry = self._entries.get(trace)
+        if (
+            not entry
+            or entry.fields != component_fields(component)
+            or ctx_reads_changed(ctx, entry.reads)
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._keep(trace, entry)
+        for nested in entry.nested:
+            if nested_entry := self._entries.get(nested):
+                self._keep(nested, nested_entry)
+        return entry
+
+    @contextmanager
+    def rendering(
+        self, trace: RenderTrace, component: Component[Any], reads: dict[str, Any]
+    ) -> Iterator[MemoEntry]:
+        entry = MemoEntry(fields=component_fields(component), reads=reads)
+        self._rendering.append(entry.nested)
+        try:
+            yield entry
+        finally:
+            self._rendering.pop()
+        self._keep(trace, entry)
+        if self._rendering:
+            self._rendering[-1].extend(entry.nested)
@@ -13,7 +13,7 @@ from react_tk.renderable.component import (
     RenderResult,
     is_render_element,
 )
-from react_tk.renderable.context import Ctx
+from react_tk.renderable.context import Ctx, ctx_record_reads, ctx_track_reads
 from react_tk.renderable.node.shadow_node import ShadowNode
 from react_tk.renderable.trace import (
     ConstructTraceAccessor,
@@ -22,15 +22,26 @@ from react_tk.renderable.trace import (
     RenderTraceAccessor,
     SequencedRenderFrame,
 )
+from react_tk.rendering.component.memo import MemoCache, is_memo
+from react_tk.rendering.component.validation import Validator
 import funcy
 
 
 class RenderState:
     _next_render_trace_seq_id: dict[tuple[RenderTrace, RenderFrame], int]
 
-    def __init__(self, ctx: AbsCtx) -> None:
+    def __init__(
+        self,
+        ctx: AbsCtx,
+        memo: MemoCache | None = None,
+        validate: Validator | None = None,
+    ) -> None:
         self._next_render_trace_seq_id = defaultdict(lambda: 0)
         self.ctx = ctx
+        self.memo = memo
+        self.validate = validate or Validator()
+        if memo:
+            memo.begin()
 
     def create_empty_sink(self) -> "RenderSink":
         return RenderSink(state=self, trace_root=RenderTrace())
@@ -38,8 +49,10 @@ class RenderState:
     def produce_sequenced(
         self, trace: RenderTrace, frame: RenderFrame
     ) -> SequencedRenderFrame:
-        free_seq_id = self._next_render_trace_seq_id[(trace, frame)]
-        self._next_render_trace_seq_id[(trace, frame)] += 1
+        # Hashing a trace is O(1), so this doesn't grow with depth.
+        key = (trace, frame)
+        free_seq_id = self._next_render_trace_seq_id[key]
+        self._next_render_trace_seq_id[key] = free_seq_id + 1
         return frame.to_sequenced(free_seq_id)
 
 
@@ -67,7 +80,7 @@ class RenderSink[Node: ShadowNode[Any] = ShadowNode[Any]](AbsSink[Node]):
         match node:
             case ShadowNode():
                 node = node.__merge__(KIDS=new_sink.run(node.KIDS))
-                node.PROPS.assert_valid()
+                self.state.validate(node)
                 return node
             case Component():
                 return new_sink._run_component_render(node)
@@ -89,5 +102,19 @@ class RenderSink[Node: ShadowNode[Any] = ShadowNode[Any]](AbsSink[Node]):
 
     def _run_component_render(self, component: Component[Node]) -> RenderResult[Node]:
         component.ctx = self.ctx
-        results = component.render()
-        return self.run(results)
+        memo = self.state.memo
+        ctx = self.ctx
+        if memo is None or not isinstance(ctx, Ctx) or not is_memo(component):
+            results = component.render()
+            return self.run(results)
+
+        trace = RenderTraceAccessor(component).get()
+        if cached := memo.lookup(trace, component, ctx):
+            ctx_record_reads(ctx, cached.reads)
+            return cached.result  # type: ignore[return-value]
+        with (
+            ctx_track_reads(ctx) as reads,
+            memo.rendering(trace, component, reads) as entry,
+        ):
+            entry.result = self.run(component.render())
+        return entry.result  # type: ignore[return-value]
@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from random import Random
+from time import perf_counter
+from typing import Any
+
+from react_tk.renderable.node.shadow_node import ShadowNode
+from react_tk.renderable.trace import ConstructTraceAccessor
+from react_tk.rendering.options import ValidationMode
+from react_tk.util.stack import ReactTkFrameInfo
+
+
+@dataclass
+class ValidationStats:
+    mode: ValidationMode
+    checked: int = field(default=0)
+    skipped: int = field(default=0)
+    duration: float = field(default=0.0)
+
+    def __str__(self) -> str:
+        return (
+            f"🔎 {self.mode}: {self.checked} checked, {self.skipped} skipped"
+            f" in {self.duration * 1000:.2f}ms"
+        )
+
+
+class Validator:
+    """Decides which rendered nodes get their props validated, and counts
+    what that costs."""
+
+    def __init__(
+        self, mode: ValidationMode = "always", sample_rate: float = 0.1
+    ) -> None:
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.stats = ValidationStats(mode)
+        self._seen: set[ReactTkFrameInfo] = set()
+        self._random = Random()
+
+    def _should_check(self, node: ShadowNode[Any]) -> bool:
+        match self.mode:
+            case "always":
+                return True
+            case "off":
+                return False
+            case "sampled":
+                return self._random.random() < self.sample_rate
+            case "first-seen":
+                site = ConstructTraceAccessor(node).get()
+                if site in self._seen:
+                    return False
+                self._seen.add(site)
+                return True
+            case mode:
+                raise ValueError(f"Unknown validation mode: {mode}")
+
+    def __call__(self, node: ShadowNode[Any]) -> None:
+        if not self._should_check(node):
+            self.stats.skipped += 1
+            return
+        started = perf_counter()
+        try:
+            node.PROPS.assert_valid()
+        finally:
+            self.stats.duration += perf_counter() - started
+            self.stats.checked += 1
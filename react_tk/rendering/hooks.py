@@ -0,0 +1,94 @@
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Self
+
+from react_tk.rendering.actions.actions import ReconcileAction
+
+if TYPE_CHECKING:
+    from react_tk.rendering.actions.commit_batch import CommitBatch
+
+logger = getLogger("react_tk")
+
+
+class Hook[Event]:
+    """Listeners for one kind of event. Add one with `+=` and remove it with
+    `-=`. A hook without listeners is falsy, so callers can skip building the
+    event."""
+
+    __slots__ = ("_listeners",)
+
+    def __init__(self) -> None:
+        self._listeners: list[Callable[[Event], Any]] = []
+
+    def __iadd__(self, listener: Callable[[Event], Any]) -> Self:
+        self._listeners.append(listener)
+        return self
+
+    def __isub__(self, listener: Callable[[Event], Any]) -> Self:
+        self._listeners.remove(listener)
+        return self
+
+    def __bool__(self) -> bool:
+        return bool(self._listeners)
+
+    def __call__(self, event: Event) -> None:
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Hook listener failed on %r", event)
+
+
+def count_actions(actions: Iterable[ReconcileAction[Any]]) -> Counter[str]:
+    """How many actions there are of each type, by type name."""
+    return Counter(type(action).__name__ for action in actions)
+
+
+@dataclass(frozen=True)
+class RenderStart:
+    frame: int
+
+
+@dataclass(frozen=True)
+class RenderEnd:
+    frame: int
+    duration: float
+    # Shadow nodes in the rendered tree.
+    nodes: int
+
+
+@dataclass(frozen=True)
+class ActionsComputed:
+    duration: float
+    counts: Counter[str]
+
+    @property
+    def size(self) -> int:
+        return self.counts.total()
+
+
+@dataclass(frozen=True)
+class ActionRun:
+    action: ReconcileAction[Any]
+    duration: float
+
+
+@dataclass
+class RenderHooks:
+    """Timing events of a `RenderRoot`, for telemetry.
+
+    Nothing is measured or built for a hook without listeners. Rendering hooks
+    fire on the thread that renders. The rest fire where the frame is
+    reconciled, which is the commit thread with `pipeline`. `on_action` fires
+    where the action runs, which for Tk widgets is the Tk thread. Window
+    actions post their work to the Tk thread, so theirs fire once that work has
+    run, and their duration includes it.
+    """
+
+    on_render_start: Hook[RenderStart] = field(default_factory=Hook)
+    on_render_end: Hook[RenderEnd] = field(default_factory=Hook)
+    on_compute_actions: Hook[ActionsComputed] = field(default_factory=Hook)
+    on_commit_batch: "Hook[CommitBatch]" = field(default_factory=Hook)
+    on_action: Hook[ActionRun] = field(default_factory=Hook)
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from typing import Literal
+
+type ValidationMode = Literal["always", "first-seen", "sampled", "off"]
+
+
+@dataclass(kw_only=True)
+class RenderOptions:
+    """Knobs for a `RenderRoot`.
+
+    `validate` picks how often rendered nodes have their props type-checked:
+
+    - "always" checks every node on every render.
+    - "first-seen" checks the first node built at each construct site.
+    - "sampled" checks a random `sample_rate` fraction of nodes.
+    - "off" never checks, for production builds.
+
+    With `coalesce`, context updates mark the root dirty and it renders once on
+    the next tick of the context's loop, at most `max_fps` times a second
+    (`None` for no limit). Without it, every update renders right away.
+
+    With `pipeline`, each frame is diffed and committed on a separate thread, so
+    the next one can render in the meantime. A rendered frame that's replaced
+    by a newer one before its commit starts is dropped.
+
+    With `evict_after`, a resource that stays unplaced for that many renders is
+    destroyed and its reconcile state forgotten, so it's created again if it
+    comes back. The default `None` keeps everything for the life of the root.
+    """
+
+    validate: ValidationMode = field(default="always")
+    sample_rate: float = field(default=0.1)
+    coalesce: bool = field(default=True)
+    max_fps: float | None = field(default=60.0)
+    pipeline: bool = field(default=False)
+    evict_after: int | None = field(default=None)
@@ -0,0 +1,73 @@
+from collections.abc import Callable
+from logging import getLogger
+import threading
+from typing import Any
+
+from react_tk.renderable.node.shadow_node import ShadowNode
+
+logger = getLogger("react_tk")
+
+type Frame = tuple[ShadowNode[Any], ...]
+
+
+class FrameCommitter:
+    """Diffs and commits rendered frames on its own thread.
+
+    Rendered frames wait in a single slot. Submitting a frame while another is
+    still waiting replaces it, so a frame superseded before its commit starts is
+    dropped and never reaches the UI.
+    """
+
+    committed: int
+    dropped: int
+
+    def __init__(self, commit: Callable[[Frame], Any], name: str) -> None:
+        self._commit = commit
+        self._cond = threading.Condition()
+        self._pending: Frame | None = None
+        self._busy = False
+        self._stopped = False
+        self.committed = 0
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, frame: Frame) -> None:
+        with self._cond:
+            if self._pending is not None:
+                self.dropped += 1
+                logger.debug("Dropping a frame superseded before its commit")
+            self._pending = frame
+            self._cond.notify_all()
+
+    def _take(self) -> Frame | None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending is not None or self._stopped)
+            frame, self._pending = self._pending, None
+            self._busy = frame is not None
+            return frame
+
+    def _run(self) -> None:
+        while (frame := self._take()) is not None:
+            try:
+                self._commit(frame)
+            except Exception:
+                logger.exception("Failed to commit frame")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self.committed += 1
+                    self._cond.notify_all()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Waits until every submitted frame is committed or dropped."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._pending is None and not self._busy, timeout
+            )
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._pending = None
+            self._cond.notify_all()
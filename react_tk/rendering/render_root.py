@@ -1,3 +1,7 @@
+from logging import getLogger
+import threading
+from time import perf_counter
+from weakref import finalize
 from typing import Any
 from react_tk.interaction.scheduler import Scheduler
 from react_tk.renderable.component import Component
@@ -5,26 +9,131 @@ from react_tk.renderable.context import Ctx, ctx_freeze
 from react_tk.renderable.node.shadow_node import ShadowNode
 from react_tk.rendering.actions.reconcile_state import PersistentReconcileState
 from react_tk.rendering.actions.top_reconciler import RootReconciler
+from react_tk.rendering.component.memo import MemoCache
 from react_tk.rendering.component.render_sink import RenderSink, RenderState
+from react_tk.rendering.component.validation import Validator
+from react_tk.rendering.hooks import RenderEnd, RenderHooks, RenderStart
+from react_tk.rendering.options import RenderOptions
+from react_tk.rendering.pipeline import FrameCommitter
+
+logger = getLogger("react_tk")
+
+
+def _count_nodes(nodes: tuple[ShadowNode[Any], ...]) -> int:
+    count = 0
+    todo = list(nodes)
+    while todo:
+        node = todo.pop()
+        count += 1
+        todo.extend(node.KIDS)
+    return count
 
 
 class RenderRoot[Node: ShadowNode[Any] = ShadowNode[Any]]:
     _reconciler: RootReconciler[Node]
     _mounted: Component[Node]
 
-    def __init__(self, initial: Component[Node], **context_kwargs: Any) -> None:
+    def __init__(
+        self,
+        initial: Component[Node],
+        *,
+        options: RenderOptions | None = None,
+        **context_kwargs: Any,
+    ) -> None:
         self._mounted = initial
+        self.options = options or RenderOptions()
+        self._memo = MemoCache()
+        self.validator = Validator(self.options.validate, self.options.sample_rate)
         self.ctx = Ctx(**context_kwargs)
-        self.ctx += lambda _: self._rerender()
-        self._reconciler = RootReconciler(PersistentReconcileState())
-        self._rerender()
+        self.ctx += lambda _: self._invalidate()
+        if self.options.max_fps:
+            self.ctx.frame_interval = 1 / self.options.max_fps
+        # Listeners added here see every frame after the first.
+        self.hooks = RenderHooks()
+        self._reconciler = RootReconciler(
+            PersistentReconcileState(),
+            evict_after=self.options.evict_after,
+            hooks=self.hooks,
+        )
+        self._dirty = False
+        self._dirty_lock = threading.Lock()
+        self._render_lock = threading.RLock()
+        self._last_frame = 0.0
+        self.frames = 0
+        self.updates = 0
+        self._committer: FrameCommitter | None = None
+        self._reconciler.reconcile(self._render())
+        if self.options.pipeline:
+            self._committer = FrameCommitter(
+                self._reconciler.reconcile, name="react_tk.commit"
+            )
+            finalize(self, self._committer.stop)
 
     def __call__(self, **kwargs: Any) -> None:
         self.ctx(**kwargs)
 
+    def _invalidate(self) -> None:
+        self.updates += 1
+        if not self.options.coalesce:
+            self._rerender()
+            return
+        with self._dirty_lock:
+            if self._dirty:
+                return
+            self._dirty = True
+        interval = 1 / self.options.max_fps if self.options.max_fps else 0.0
+        delay = max(0.0, self._last_frame + interval - perf_counter())
+        loop = self.ctx._loop
+        loop.call_soon_threadsafe(loop.call_later, delay, self._flush_dirty)
+
+    def _flush_dirty(self) -> None:
+        # Taking the render lock first means that finding nothing dirty also
+        # waits out a render that's already under way.
+        with self._render_lock:
+            with self._dirty_lock:
+                if not self._dirty:
+                    return
+                self._dirty = False
+            self._rerender()
+
+    def flush(self) -> None:
+        """Renders now if there are updates that haven't been rendered yet, and
+        waits until they're committed."""
+        self._flush_dirty()
+        if self._committer:
+            self._committer.wait_idle()
+
     def _rerender(self):
+        with self._render_lock:
+            frame = self._render()
+            if self._committer:
+                # Submitted under the lock, so frames reach the committer in the
+                # order they were rendered. The next frame can render while this
+                # one is diffed and committed.
+                self._committer.submit(frame)
+            else:
+                self._reconciler.reconcile(frame)
+
+    def _render(self) -> tuple[ShadowNode[Any], ...]:
+        self._last_frame = started = perf_counter()
+        self.frames += 1
+        hooks = self.hooks
+        if hooks.on_render_start:
+            hooks.on_render_start(RenderStart(self.frames))
         with ctx_freeze(self.ctx):
-            render_state = RenderState(self.ctx)
+            render_state = RenderState(
+                self.ctx, memo=self._memo, validate=self.validator
+            )
             sink = render_state.create_empty_sink()
             render_result = sink.run(self._mounted)
-        self._reconciler.reconcile(tuple(render_result))
+            self._memo.commit()
+        logger.debug("%s", self.validator.stats)
+        if hooks.on_render_end:
+            hooks.on_render_end(
+                RenderEnd(
+                    self.frames,
+                    perf_counter() - started,
+                    _count_nodes(render_result),
+                )
+            )
+        return tuple(render_result)
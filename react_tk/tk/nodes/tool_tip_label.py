@@ -4,8 +4,6 @@ from react_tk.rendering.actions.node_reconciler import reconciler
 from react_tk.rendering.actions.reconcile_state import RenderedNode
 from react_tk.tk.nodes.label import Label, LabelReconciler
 
-from react_tk.tk.win32.tweaks import make_clickthrough
-
 
 class ToolTipLabelReconciler(LabelReconciler):
 
@@ -14,6 +12,8 @@ class ToolTipLabelReconciler(LabelReconciler):
     ) -> RenderedNode["tkinter.Widget"]:
         label = super()._create(container, node)
         try:
+            from react_tk.tk.win32.tweaks import make_clickthrough
+
             make_clickthrough(label.resource)
         except ImportError:
             return LabelReconciler._create(self, container, node)
@@ -1,12 +1,12 @@
 from abc import abstractmethod
 from dataclasses import dataclass
-import threading
 from tkinter import Misc, Tk, Widget, Label as TkLabel
 from react_tk.renderable.node.prop_value_accessor import PropValuesAccessor
 from react_tk.rendering.actions.node_reconciler import Compat
 from react_tk.renderable.node.shadow_node import ShadowNode
 from react_tk.props.impl.prop import Prop_ComputedMapping
 from react_tk.rendering.actions.actions import (
+    ActionLogLine,
     Create,
     Place,
     ReconcileAction,
@@ -19,36 +19,43 @@ from react_tk.rendering.actions.compute import AnyNode, logger
 from react_tk.rendering.actions.reconcile_state import (
     PersistentReconcileState,
     TransientReconcileState,
+    same_identity,
 )
 
-from react_tk.rendering.actions.node_reconciler import ReconcilerBase
+from react_tk.rendering.actions.node_reconciler import (
+    ReconcilerAccessor,
+    ReconcilerBase,
+    run_actions,
+)
 
-from typing import Any, Callable, Iterable, override
+from typing import Any, Callable, Iterable, Sequence, override
 
 from react_tk.tk.types.font import to_tk_font
-from react_tk.tk.util.tk import get_pack_position
-from react_tk.tk.win32.tweaks import make_clickthrough
+from react_tk.tk.util.command_queue import command_queue
+from react_tk.tk.util.pack_order import pack_order
+from react_tk.tk.util.widget_pool import widget_pool
 
 
 @dataclass
 class WidgetReconciler(ReconcilerBase[Widget]):
     state: TransientReconcileState
-    waiter = threading.Event()
 
     @classmethod
     def create(cls, state: TransientReconcileState) -> "WidgetReconciler":
         return cls(state)
 
+    @classmethod
+    @override
+    def batch_domain(cls) -> "type[ReconcilerBase[Any]]":
+        return WidgetReconciler
+
     @classmethod
     @override
     def get_compatibility(cls, older: RenderedNode[Widget], newer: AnyNode) -> Compat:
         # TODO: Find a better way to determine compatibility
-        if older.node.__info__.uid != newer.__info__.uid:
+        if not same_identity(older.node, newer):
             return "switch"
-        pack_info = older.resource.pack_info()
-        in_ = pack_info.get("in", None)
-        assert in_ is not None
-        if in_.winfo_name() == "limbo":
+        if not pack_order(older.resource).is_placed(older.resource):
             return "place"
         return "update"
 
@@ -57,11 +64,6 @@ class WidgetReconciler(ReconcilerBase[Widget]):
         self, container: Widget | Tk, node: AnyNode
     ) -> RenderedNode[Widget]: ...
 
-    def _pack(self, resource: Widget, diff: Prop_ComputedMapping):
-        resource.pack_configure(
-            **diff.source.compute().values.get("Pack", {}),
-        )
-
     def _pack_at(
         self,
         container: ShadowNode[Any],
@@ -69,13 +71,20 @@ class WidgetReconciler(ReconcilerBase[Widget]):
         at: int,
     ):
         rendered_container = self.state[container]
-        pack_pos = get_pack_position(rendered_container.resource, at)
+        previous = self._previous_sibling(container, at)
+        order = pack_order(resource)
+        pack_pos = order.position(
+            rendered_container.resource,
+            resource,
+            previous.resource if previous else None,
+        )
         positioning = {
             "in_": rendered_container.resource,
             **(pack_pos.to_dict() if pack_pos else {}),
         }
 
         resource.pack_configure(**positioning)
+        order.pack(resource, rendered_container.resource, pack_pos)
 
     def _update(self, resource: Widget, props: Prop_ComputedMapping) -> None:
         diff = props.values
@@ -84,6 +93,7 @@ class WidgetReconciler(ReconcilerBase[Widget]):
             configure["font"] = to_tk_font(diff["font"])
         resource.configure(**diff.get("configure", {}))
         resource.pack_configure(**diff.get("Pack", {}))
+        pack_order(resource).configure(resource)
 
     def _get_some_ui_resource(self, node: ReconcileAction[Widget]) -> Widget | Tk:
         match node:
@@ -91,7 +101,7 @@ class WidgetReconciler(ReconcilerBase[Widget]):
                 return existing.resource
             case x:
                 container = x.container
-                return self.state.existing_resources[container.__info__.uid].resource
+                return self.state[container].resource
 
     def _get_root(self, node: Misc) -> Tk:
         while node.master:
@@ -99,14 +109,14 @@ class WidgetReconciler(ReconcilerBase[Widget]):
         return node  # type: ignore[return-value]
 
     def _get_master_from_container(self, container: AnyNode) -> Tk:
-        master = self.state.existing_resources[container.__info__.uid].resource
+        master = self.state[container].resource
         return self._get_root(master)
 
     def _do_create_action(self, action: Update[Widget] | Create[Widget]):
         match action:
             case Create(next, container) as c:
                 master_root = self._get_master_from_container(container)
-                new_resource = self._create(master_root, next)
+                new_resource = self._create_or_reuse(master_root, next)
                 self._update(new_resource.resource, c.diff)
                 self._register(next, new_resource.resource)
                 return new_resource
@@ -117,40 +127,93 @@ class WidgetReconciler(ReconcilerBase[Widget]):
             case _:
                 assert False, f"Unknown action: {action}"
 
+    def _create_or_reuse(self, master: Tk, node: AnyNode) -> RenderedNode[Widget]:
+        reused = widget_pool(master).acquire(ReconcilerAccessor(node).get())
+        if reused is not None:
+            return RenderedNode(reused, node)
+        return self._create(master, node)
+
+    def _release(self, rendered: RenderedNode[Widget]) -> None:
+        # Forgetting the node means it's created again if it comes back, most
+        # likely from the pool.
+        del self.state.existing_resources[self.state.id_of(rendered.node)]
+        pack_order(rendered.resource).forget(rendered.resource)
+        widget_pool(rendered.resource).release(
+            ReconcilerAccessor(rendered.node).get(), rendered.resource
+        )
+
     def _unplace(self, rendered: RenderedNode[Widget]):
         if self.state.will_be_placed(rendered.node):
             return
+        if not pack_order(rendered.resource).slaves(rendered.resource):
+            # Containers keep their children packed in them, so only leaves
+            # can be reused.
+            self._release(rendered)
+            return
         root = self._get_root(rendered.resource)
         limbo = root.nametowidget("limbo")
         rendered.resource.pack(in_=limbo)
+        pack_order(root).unplace(rendered.resource, limbo)
+
+    @override
+    def evict(self, rendered: RenderedNode[Widget]) -> None:
+        resource = rendered.resource
+
+        def destroy():
+            pack_order(resource).forget(resource)
+            resource.destroy()
+
+        command_queue(self._get_root(resource)).post(destroy)
 
     def _run_action_main_thread(self, action: ReconcileAction[Widget]):
-        try:
-            if action:
-                # FIXME: This should be an externalized event
-                logger.info(f"⚖️  RECONCILE {action}")
-            else:
-                logger.info(f"🚫 RECONCILE {action.key} ")
-
-            match action:
-                case Replace(container, replaces, with_what, at):
-                    self._unplace(replaces)
-                    cur = self._do_create_action(with_what)
-                    self._pack_at(container, cur.resource, at)
-                case Update(existing, next):
-                    self._do_create_action(action)
-                case Unplace(existing):
-                    self._unplace(existing)
-                case Place(container, at, createAction) as x:
-                    cur = self._do_create_action(createAction)
-                    self._pack_at(container, cur.resource, at)
-                case _:
-                    assert False, f"Unknown action: {action}"
-        finally:
-            self.waiter.set()
-
-    def run_action(self, action: ReconcileAction[Widget], log=True):
-        existing_parent = self._get_some_ui_resource(action)
-        self.waiter.clear()
-        existing_parent.after(0, lambda: self._run_action_main_thread(action))
-        self.waiter.wait()
+        logger.info("%s", ActionLogLine(action))
+
+        match action:
+            case Replace(container, replaces, with_what, at):
+                self._unplace(replaces)
+                cur = self._do_create_action(with_what)
+                self._pack_at(container, cur.resource, at)
+            case Update(existing, next):
+                self._do_create_action(action)
+            case Unplace(existing):
+                self._unplace(existing)
+            case Place(container, at, createAction) as x:
+                cur = self._do_create_action(createAction)
+                self._pack_at(container, cur.resource, at)
+            case _:
+                assert False, f"Unknown action: {action}"
+
+    @staticmethod
+    def _for_action(
+        state: TransientReconcileState, action: ReconcileAction[Widget]
+    ) -> "WidgetReconciler":
+        reconciler = ReconcilerAccessor(action.node).get().create(state)
+        assert isinstance(reconciler, WidgetReconciler)
+        return reconciler
+
+    @classmethod
+    @override
+    def run_batch(
+        cls, state: TransientReconcileState, actions: Sequence[ReconcileAction[Widget]]
+    ) -> None:
+        if not actions:
+            return
+        first = cls._for_action(state, actions[0])
+        root = first._get_root(first._get_some_ui_resource(actions[0]))
+        queue = command_queue(root)
+
+        def run(action: ReconcileAction[Widget]) -> None:
+            try:
+                cls._for_action(state, action)._run_action_main_thread(action)
+            except Exception:
+                logger.exception("Failed to reconcile %r", action)
+
+        def commit():
+            run_actions(state, actions, run)
+
+        queue.post(commit)
+        queue.barrier()
+        logger.debug("%s", widget_pool(root).stats)
+
+    def run_action(self, action: ReconcileAction[Widget]):
+        self.run_batch(self.state, [action])
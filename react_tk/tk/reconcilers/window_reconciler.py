@@ -1,14 +1,16 @@
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 import threading
+from time import perf_counter
 from tkinter import Tk
 from tkinter.ttk import Frame
-from typing import Any
+from typing import Any, Sequence, override
 from react_tk.rendering.actions.node_reconciler import Compat
 from react_tk.renderable.node.shadow_node import ShadowNode
 from react_tk.props.impl.prop import Prop_ComputedMapping
 from react_tk.rendering.actions.actions import (
+    ActionLogLine,
     Create,
     ReconcileAction,
     RenderedNode,
@@ -22,14 +24,28 @@ from react_tk.rendering.actions.reconcile_state import (
     PersistentReconcileState,
     TransientReconcileState,
 )
+from react_tk.rendering.hooks import ActionRun
 from react_tk.tk.types.geometry import Geometry
 from react_tk.tk.reconcilers.widget_reconciler import WidgetReconciler
+from react_tk.tk.util.command_queue import CommandQueue, barrier, command_queue
 
 logger = logging.getLogger("react_tk")
 
 
+def _timed(durations: list[float], func: Callable[[], Any]) -> None:
+    started = perf_counter()
+    try:
+        func()
+    finally:
+        durations.append(perf_counter() - started)
+
+
 @dataclass
 class WindowReconciler(ReconcilerBase[Tk]):
+    _posted: set[CommandQueue] = field(default_factory=set, init=False)
+    # Where the commands posted for the current action add how long they took
+    # on the Tk thread, while actions are being timed.
+    _durations: list[float] | None = field(default=None, init=False)
 
     @classmethod
     def create(cls, state: TransientReconcileState) -> "WindowReconciler":
@@ -41,17 +57,13 @@ class WindowReconciler(ReconcilerBase[Tk]):
     ) -> Compat:
         return "update"
 
-    def _schedule_and_wait(self, resource: Tk, func: Callable[[], Any]) -> Any:
-        result = [None]
-        event = threading.Event()
-
-        def wrapper():
-            result[0] = func()
-            event.set()
-
-        resource.after(0, wrapper)
-        event.wait()
-        return result[0]
+    def _post(self, resource: Tk, func: Callable[[], Any]) -> None:
+        queue = command_queue(resource)
+        if (durations := self._durations) is not None:
+            queue.post(lambda: _timed(durations, func))
+        else:
+            queue.post(func)
+        self._posted.add(queue)
 
     def _normalize_geo(self, existing: Tk, geo: Geometry) -> str:
         x, y, width, height = (geo[k] for k in ("x", "y", "width", "height"))
@@ -77,7 +89,7 @@ class WindowReconciler(ReconcilerBase[Tk]):
             resource = pair.resource
             resource.deiconify()
 
-        self._schedule_and_wait(pair.resource, do_place)
+        self._post(pair.resource, do_place)
 
     def _replace(
         self, existing: RenderedNode[Tk], replacement: RenderedNode[Tk]
@@ -87,7 +99,7 @@ class WindowReconciler(ReconcilerBase[Tk]):
         def do_replace():
             replacement.resource.deiconify()
 
-        self._schedule_and_wait(replacement.resource, do_replace)
+        self._post(replacement.resource, do_replace)
 
     def _update(self, rendered: RenderedNode[Tk], props: Prop_ComputedMapping) -> None:
         def do_update():
@@ -105,7 +117,7 @@ class WindowReconciler(ReconcilerBase[Tk]):
             if (override_redirect := props.values.get("override_redirect")) is not None:
                 resource.overrideredirect(override_redirect)
 
-        self._schedule_and_wait(rendered.resource, do_update)
+        self._post(rendered.resource, do_update)
 
     def _unplace(self, resource: RenderedNode[Tk]) -> None:
         if self.state.will_be_placed(resource.node):
@@ -115,7 +127,7 @@ class WindowReconciler(ReconcilerBase[Tk]):
         def do_unplace():
             resource.resource.withdraw()
 
-        self._schedule_and_wait(resource.resource, do_unplace)
+        self._post(resource.resource, do_unplace)
 
     def _create_window(self, node: ShadowNode[Any]) -> "RenderedNode[Tk]":
         waiter = threading.Event()
@@ -139,7 +151,11 @@ class WindowReconciler(ReconcilerBase[Tk]):
         def do_destroy():
             resource.destroy()
 
-        self._schedule_and_wait(resource, do_destroy)
+        self._post(resource, do_destroy)
+
+    @override
+    def evict(self, rendered: RenderedNode[Tk]) -> None:
+        self._destroy(rendered.resource)
 
     def _do_create_action(self, action: Update[Tk] | Create[Tk]):
         match action:
@@ -156,12 +172,8 @@ class WindowReconciler(ReconcilerBase[Tk]):
             case _:
                 assert False, f"Unknown action: {action}"
 
-    def run_action(self, action: ReconcileAction[Tk]) -> None:
-        if action:
-            # FIXME: This should be an externalized event
-            logger.info(f"⚖️  RECONCILE {action}")
-        else:
-            logger.info(f"🚫 RECONCILE {action.key} ")
+    def _run_action(self, action: ReconcileAction[Tk]) -> None:
+        logger.info("%s", ActionLogLine(action))
 
         match action:
             case Replace(_, replaces, with_what, _):
@@ -177,3 +189,32 @@ class WindowReconciler(ReconcilerBase[Tk]):
                 self._place(cur)
             case _:
                 assert False, f"Unknown action: {action}"
+
+    @classmethod
+    @override
+    def run_batch(
+        cls, state: TransientReconcileState, actions: Sequence[ReconcileAction[Tk]]
+    ) -> None:
+        reconciler = cls.create(state)
+        on_action = state.hooks.on_action if state.hooks else None
+        if not on_action:
+            for action in actions:
+                reconciler._run_action(action)
+            barrier(*reconciler._posted)
+            return
+        # Most of the work is posted to the Tk thread, so an action's duration
+        # is the time it ran here plus the time its commands took there. It's
+        # only known once they've run.
+        runs: list[tuple[ReconcileAction[Tk], float, list[float]]] = []
+        for action in actions:
+            reconciler._durations = durations = []
+            started = perf_counter()
+            reconciler._run_action(action)
+            runs.append((action, perf_counter() - started, durations))
+        reconciler._durations = None
+        barrier(*reconciler._posted)
+        for action, duration, durations in runs:
+            on_action(ActionRun(action, duration + sum(durations)))
+
+    def run_action(self, action: ReconcileAction[Tk]) -> None:
+        self.run_batch(self.state, [action])
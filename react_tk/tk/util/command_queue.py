@@ -0,0 +1,77 @@
+from collections import deque
+from collections.abc import Callable
+from logging import getLogger
+import threading
+from tkinter import Tk
+from typing import Any
+
+from react_tk.reflect.accessor.base import KeyAccessor
+
+logger = getLogger("react_tk")
+
+type Command = Callable[[], Any]
+
+
+class CommandQueue:
+    """Commands for one Tk root, run in order on its UI thread.
+
+    Any thread can post. Posting never blocks: the first command posted to an
+    idle queue schedules one drain with `after(0)`, and that drain runs
+    everything queued by the time it gets there. To wait for the commands
+    posted so far, use `barrier()`.
+    """
+
+    def __init__(self, root: Tk) -> None:
+        self._root = root
+        self._commands: deque[Command] = deque()
+        self._scheduled = False
+
+    def post(self, command: Command) -> None:
+        # deque appends and pops are atomic. The flag is checked after the
+        # append and cleared before draining, so a command is never stranded:
+        # at worst a drain is scheduled that finds nothing to do.
+        self._commands.append(command)
+        if not self._scheduled:
+            self._scheduled = True
+            self._root.after(0, self._drain)
+
+    def _drain(self) -> None:
+        self._scheduled = False
+        commands = self._commands
+        while commands:
+            command = commands.popleft()
+            try:
+                command()
+            except Exception:
+                logger.exception("Failed to run %r", command)
+
+    def post_barrier(self) -> threading.Event:
+        """Posts a command that sets the returned event once it runs."""
+        reached = threading.Event()
+        self.post(reached.set)
+        return reached
+
+    def barrier(self) -> None:
+        """Waits until every command posted before this call has run."""
+        self.post_barrier().wait()
+
+
+class CommandQueueAccessor(KeyAccessor[CommandQueue]):
+    @property
+    def key(self) -> str:
+        return "__react_tk_command_queue__"
+
+
+def command_queue(root: Tk) -> CommandQueue:
+    accessor = CommandQueueAccessor(root)
+    queue = accessor.get(None)
+    if queue is None:
+        queue = CommandQueue(root)
+        accessor.set(queue)
+    return queue
+
+
+def barrier(*queues: CommandQueue) -> None:
+    """Waits on several queues at once, so their UI threads drain in parallel."""
+    for reached in [queue.post_barrier() for queue in queues]:
+        reached.wait()
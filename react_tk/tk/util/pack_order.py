@@ -0,0 +1,111 @@
+from logging import getLogger
+from tkinter import Misc, Widget
+from typing import ClassVar
+
+from react_tk.reflect.accessor.base import KeyAccessor
+from react_tk.tk.util.tk import After, Before, PackPosition, get_root
+
+logger = getLogger("react_tk")
+
+
+class PackOrder:
+    """The pack order of every container under one Tk root, as the reconciler
+    left it.
+
+    Every `pack_configure` the reconciler issues goes through here, so anchors
+    for the next placement come from this model instead of `pack_slaves()` and
+    `pack_info()`, which are Tcl round trips. Set `verify` to check the model
+    against Tcl after every change, when debugging.
+    """
+
+    verify: ClassVar[bool] = False
+
+    def __init__(self) -> None:
+        self._slaves: dict[Misc, list[Widget]] = {}
+        self._in: dict[Widget, Misc] = {}
+        self._limbo: Misc | None = None
+
+    def container_of(self, widget: Widget) -> Misc | None:
+        return self._in.get(widget)
+
+    def is_placed(self, widget: Widget) -> bool:
+        container = self._in.get(widget)
+        return container is not None and container is not self._limbo
+
+    def slaves(self, container: Misc) -> list[Widget]:
+        return list(self._slaves.get(container, ()))
+
+    def position(
+        self, container: Misc, widget: Widget, after: Widget | None
+    ) -> PackPosition | None:
+        """Where to pack *widget* in *container* so it follows *after*, or comes
+        first if there's nothing before it."""
+        if after is not None:
+            return After(after)
+        slaves = self._slaves.get(container)
+        if slaves and slaves[0] is not widget:
+            return Before(slaves[0])
+        return None
+
+    def _remove(self, widget: Widget) -> None:
+        if (old := self._in.pop(widget, None)) is not None:
+            self._slaves[old].remove(widget)
+
+    def pack(
+        self, widget: Widget, container: Misc, position: PackPosition | None = None
+    ) -> None:
+        """Records `pack_configure(in_=container, ...)` with *position*."""
+        self._remove(widget)
+        slaves = self._slaves.setdefault(container, [])
+        match position:
+            case Before(anchor):
+                slaves.insert(slaves.index(anchor), widget)
+            case After(anchor):
+                slaves.insert(slaves.index(anchor) + 1, widget)
+            case None:
+                slaves.append(widget)
+        self._in[widget] = container
+        self._check(container)
+
+    def configure(self, widget: Widget) -> None:
+        """Records a `pack_configure` with no position. It only moves a widget
+        that isn't packed yet, to the end of its master."""
+        if widget not in self._in and widget.master is not None:
+            self.pack(widget, widget.master)
+
+    def forget(self, widget: Widget) -> None:
+        """Records `pack_forget()`."""
+        container = self._in.get(widget)
+        self._remove(widget)
+        if container is not None:
+            self._check(container)
+
+    def unplace(self, widget: Widget, limbo: Misc) -> None:
+        self._limbo = limbo
+        self.pack(widget, limbo)
+
+    def _check(self, container: Misc) -> None:
+        if not self.verify:
+            return
+        actual = list(container.pack_slaves())
+        expected = self._slaves.get(container, [])
+        if actual != expected:
+            raise AssertionError(
+                f"Pack order of {container} is {actual}, expected {expected}"
+            )
+
+
+class PackOrderAccessor(KeyAccessor[PackOrder]):
+    @property
+    def key(self) -> str:
+        return "__react_tk_pack_order__"
+
+
+def pack_order(widget: Misc) -> PackOrder:
+    """The pack order model of the root *widget* belongs to."""
+    accessor = PackOrderAccessor(get_root(widget))
+    order = accessor.get(None)
+    if order is None:
+        order = PackOrder()
+        accessor.set(order)
+    return order
@@ -0,0 +1,94 @@
+from collections import deque
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from tkinter import Misc, Widget
+
+from react_tk.reflect.accessor.base import KeyAccessor
+from react_tk.tk.util.tk import get_root
+
+
+@dataclass
+class PoolStats:
+    hits: int = field(default=0)
+    misses: int = field(default=0)
+    released: int = field(default=0)
+    evicted: int = field(default=0)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"♻️  {self.hits} reused, {self.misses} created ({self.hit_rate:.0%}),"
+            f" {self.released} released, {self.evicted} evicted"
+        )
+
+
+def reset_options(widget: Misc) -> None:
+    """Configures every option of *widget* that isn't at its default back to it."""
+    changed = {
+        name: spec[3]
+        for name, spec in widget.configure().items()
+        # Aliases like "bd" are (name, target) pairs.
+        if len(spec) == 5 and spec[4] != spec[3]
+    }
+    if changed:
+        widget.configure(**changed)
+
+
+class WidgetPool:
+    """Detached widgets under one Tk root, kept for reuse.
+
+    Widgets are pooled per kind, so they're only reused by the reconciler that
+    created them. Each kind keeps up to `capacity` widgets; releasing one more
+    destroys the one that was released first. A reused widget has its options
+    reset, so it looks freshly created.
+    """
+
+    def __init__(self, capacity: int = 32) -> None:
+        self.capacity = capacity
+        self.stats = PoolStats()
+        self._free: dict[Hashable, deque[Widget]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(free) for free in self._free.values())
+
+    def size(self, kind: Hashable) -> int:
+        return len(self._free.get(kind, ()))
+
+    def acquire(self, kind: Hashable) -> Widget | None:
+        free = self._free.get(kind)
+        if not free:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        widget = free.pop()
+        reset_options(widget)
+        return widget
+
+    def release(self, kind: Hashable, widget: Widget) -> None:
+        widget.pack_forget()
+        free = self._free.setdefault(kind, deque())
+        free.append(widget)
+        self.stats.released += 1
+        while len(free) > self.capacity:
+            free.popleft().destroy()
+            self.stats.evicted += 1
+
+
+class WidgetPoolAccessor(KeyAccessor[WidgetPool]):
+    @property
+    def key(self) -> str:
+        return "__react_tk_widget_pool__"
+
+
+def widget_pool(widget: Misc) -> WidgetPool:
+    """The widget pool of the root *widget* belongs to."""
+    accessor = WidgetPoolAccessor(get_root(widget))
+    pool = accessor.get(None)
+    if pool is None:
+        pool = WidgetPool()
+        accessor.set(pool)
+    return pool
@@ -16,7 +16,9 @@ from concurrent.futures import Future
 logger = getLogger("react_tk")
 
 
-def create_event_loop(trace_name: str) -> asyncio.AbstractEventLoop:
+def _start_event_loop(
+    trace_name: str, daemon: bool | None = None
+) -> tuple[asyncio.AbstractEventLoop, threading.Thread]:
 
     loop = asyncio.new_event_loop()
 
@@ -29,8 +31,57 @@ def create_event_loop(trace_name: str) -> asyncio.AbstractEventLoop:
             loop.run_forever()
         except Exception:
             logger.exception("Async loop crashed")
+        finally:
+            loop.close()
 
-    t = threading.Thread(target=_run_loop, name=trace_name)
+    t = threading.Thread(target=_run_loop, name=trace_name, daemon=daemon)
     t.start()
     event.wait()
-    return loop
+    return loop, t
+
+
+class SharedEventLoop:
+    """One background loop for everyone who acquires it.
+
+    The loop starts on the first `acquire()` and stops once every `acquire()`
+    has been matched by a `release()`. Its thread is a daemon, so an
+    unreleased loop doesn't keep the process alive.
+    """
+
+    def __init__(self, trace_name: str) -> None:
+        self.trace_name = trace_name
+        self._lock = threading.Lock()
+        self._users = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def users(self) -> int:
+        return self._users
+
+    @property
+    def thread(self) -> threading.Thread | None:
+        return self._thread
+
+    def acquire(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop, self._thread = _start_event_loop(
+                    self.trace_name, daemon=True
+                )
+            self._users += 1
+            return self._loop
+
+    def release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            if self._users or self._loop is None:
+                return
+            loop = self._loop
+            self._loop = self._thread = None
+        # The loop closes itself on its own thread once it stops, so this never
+        # blocks, even when called from that thread.
+        loop.call_soon_threadsafe(loop.stop)
+
+
+shared_loop = SharedEventLoop("react_tk.scheduler")
@@ -33,16 +33,17 @@ def set_path(d: Mapping[str, Any], path: str, value: Any) -> dict:
     """
     Set a value in a nested dictionary at the specified path.
     Creates intermediate dictionaries as needed.
-    Returns the modified dictionary.
+    Returns a new dict. Only the dicts along the path are copied; everything
+    else is shared with *d*.
     """
-    keys = path.split(".")
-    current = deep_copy(d)
-    for key in keys[:-1]:
-        if key not in current or not isinstance(current[key], dict):
-            current[key] = {}
-        current = current[key]
-    current[keys[-1]] = value
-    return current
+    key, _, rest = path.partition(".")
+    result = dict(d)
+    if rest:
+        inner = d.get(key)
+        result[key] = set_path(inner if isinstance(inner, Mapping) else {}, rest, value)
+    else:
+        result[key] = value
+    return result
 
 
 def deep_diff(existing: Mapping, newer: Mapping) -> dict:
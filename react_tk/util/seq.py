@@ -0,0 +1,31 @@
+from bisect import bisect_left
+from collections.abc import Sequence
+
+
+def longest_increasing_subsequence(values: Sequence[int]) -> list[int]:
+    """Indexes into *values* of one longest strictly increasing subsequence.
+
+    Runs in O(n log n).
+    """
+    # tails[k] is the index of the smallest value ending an increasing run of
+    # length k + 1; prev links each index to the one before it in its run.
+    tails: list[int] = []
+    tail_values: list[int] = []
+    prev: list[int] = [-1] * len(values)
+    for i, value in enumerate(values):
+        k = bisect_left(tail_values, value)
+        if k:
+            prev[i] = tails[k - 1]
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[k] = i
+            tail_values[k] = value
+    result: list[int] = []
+    i = tails[-1] if tails else -1
+    while i != -1:
+        result.append(i)
+        i = prev[i]
+    result.reverse()
+    return result
@@ -1,42 +1,61 @@
 from dataclasses import dataclass
+from functools import partial
 import sys
-from types import FrameType
+from types import CodeType, FrameType
+from weakref import ref
 
-from funcy import first
 
-
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ReactTkFrameInfo:
+    """A call site: a function's file and name, and a line in it.
+
+    Instances are interned per call site, so capturing one is a dict lookup
+    and they compare and hash by identity.
+    """
+
     filename: str
-    line: int
-    column: int
     function_name: str
+    line: int
+
+    @property
+    def column(self) -> int:
+        return 0
+
+
+# Call sites by line, for each code object by id, since hashing a code object
+# hashes all of it and equal code objects can come from different files. Code
+# objects are only held weakly, and their entries dropped once they're
+# collected, so code that's reloaded or exec'd doesn't pile up here.
+_call_sites: dict[int, dict[int, ReactTkFrameInfo]] = {}
+_code_refs: dict[int, ref[CodeType]] = {}
+
+
+def _forget_code(code_id: int, _: ref[CodeType]) -> None:
+    _call_sites.pop(code_id, None)
+    _code_refs.pop(code_id, None)
 
 
 def get_react_tk_frame_info(frame: FrameType) -> ReactTkFrameInfo:
-    co_positions = frame.f_code.co_positions()
-    first_co_position = first(co_positions)
-    if first_co_position is None:
-        raise RuntimeError("No code positions found")
-    start_line = frame.f_lineno
-    return ReactTkFrameInfo(
-        filename=frame.f_code.co_filename,
-        line=start_line,
-        column=0,
-        function_name=frame.f_code.co_name,
-    )
+    code = frame.f_code
+    line = frame.f_lineno
+    sites = _call_sites.get(id(code))
+    if sites is None:
+        sites = _call_sites[id(code)] = {}
+        _code_refs[id(code)] = ref(code, partial(_forget_code, id(code)))
+    info = sites.get(line)
+    if info is None:
+        info = sites[line] = ReactTkFrameInfo(code.co_filename, code.co_name, line)
+    return info
 
 
 def get_first_non_ctor_frame(skip: int = 0):
     frame = sys._getframe(1 + skip)
     if not frame:
         raise RuntimeError("No frame found")
-    tracked = []
     while frame.f_code.co_name in ("__init__", "__new__"):
         frame = frame.f_back
         if not frame:
             raise RuntimeError("No non-__init__ frame found")
-        tracked.append(frame)
     return frame
 
 
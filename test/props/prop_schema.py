@@ -147,6 +147,19 @@ class PropMapping_Test:
         assert isinstance(y_prop, Prop_Value)
         assert y_prop.value == Some(3)
 
+    def it_sets_by_copying_only_the_path(self):
+        mapping = two_props({"X": "hi", "Y": 3, "A": {"B": 1}, "C": {"D": 2}})
+        updated = mapping.set("A.B", 5)
+        assert updated.raw == {"X": "hi", "Y": 3, "A": {"B": 5}, "C": {"D": 2}}
+        assert mapping.raw["A"] == {"B": 1}
+        assert updated.raw["C"] is mapping.raw["C"]
+
+    def it_shares_what_a_merge_leaves_alone(self):
+        mapping = two_props({"X": "hi", "Y": 3, "A": {"B": 1}, "C": {"D": 2}})
+        merged = mapping.merge({"A": {"E": 3}})
+        assert merged.raw["A"] == {"B": 1, "E": 3}
+        assert merged.raw["C"] is mapping.raw["C"]
+
     def it_diffs_another_mapping(self):
         other = two_props({"X": "there", "Y": 3})
         diff = self.mapping.diff(other)
@@ -164,3 +177,47 @@ class PropMapping_Test:
         diff = self.mapping.diff(other)
         assert isinstance(diff, Prop_ComputedMapping)
         assert diff == {}
+
+    def it_computes_nested_schemas(self):
+        outer = Prop_Schema(
+            path=(),
+            name="O",
+            props=[
+                Prop(name="key", value_type=str, path=(), no_value=Some("")),
+                Prop(name="KIDS", value_type=tuple, path=(), no_value=Some(())),
+                two_props,
+            ],
+        )
+        result = outer({"key": "k", "A": {"X": "hi", "Y": 3}}).compute()
+        assert result == {"A": {"__X__": "hi", "__Y__": 3}}
+
+    def it_fails_to_compute_missing_required(self):
+        with pytest.raises(ValueError):
+            two_props({"X": "hi"}).compute()
+
+    def it_recompiles_after_update(self):
+        assert self.mapping.compute() == {"__X__": "hi", "__Y__": 3}
+        extra = two_props.update(
+            [Prop(name="Z", value_type=int, path=(), no_value=Some(1))]
+        )
+        assert extra({"X": "hi", "Y": 3}).compute() == {
+            "__X__": "hi",
+            "__Y__": 3,
+            "Z": 1,
+        }
+
+    def it_diffs_like_the_full_computation(self):
+        outer = Prop_Schema(
+            path=(),
+            name="O",
+            props=[
+                two_props,
+                Prop(name="D", value_type=dict, path=(), no_value=Some({})),
+                Prop(name="S", value_type=int, path=(), subsection="sub"),
+            ],
+        )
+        a = outer({"A": {"X": "hi", "Y": 3}, "D": {"p": 1, "q": 2}, "S": 1})
+        b = outer({"A": {"X": "hi", "Y": 4}, "D": {"p": 1, "q": 3}, "S": 1})
+        assert a.diff(b) == a.compute().diff(b.compute())
+        assert a.diff(b) == {"A": {"__Y__": 4}, "D": {"q": 3}}
+        assert a.diff(a.merge({})) == {}
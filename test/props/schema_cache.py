@@ -0,0 +1,124 @@
+from typing import Annotated, Any, NotRequired, TypedDict
+
+import pytest
+from expression import Some
+
+from react_tk.props.annotations import create_props, prop_meta, schema_cache
+from react_tk.props.annotations.create_props import read_props_from_top_class
+from react_tk.props.annotations.schema_cache import ENV_VAR, SchemaCache
+from react_tk.props.impl.prop import Prop, Prop_Any, Prop_Schema
+
+
+class Base_Props(TypedDict):
+    a: Annotated[NotRequired[str], prop_meta(no_value="", subsection="configure")]
+    b: int
+
+
+class Left_Props(Base_Props):
+    c: str
+
+
+class Right_Props(Base_Props):
+    d: Annotated[int, prop_meta(name="__d__")]
+
+
+class Outer(TypedDict):
+    left: Left_Props
+    right: Right_Props
+
+
+class Redeclared_Props(Base_Props):
+    b: Annotated[int, prop_meta(no_value=0)]
+
+
+def _dump(prop: Prop_Any) -> Any:
+    match prop:
+        case Prop():
+            return (
+                prop.path,
+                prop.name,
+                prop.value_type,
+                prop.no_value,
+                prop.computed_name,
+                prop.subsection,
+                prop.diff,
+            )
+        case Prop_Schema():
+            return (prop.path, prop.name, prop.diff, [_dump(p) for p in prop])
+
+
+def _section(schema: Prop_Schema, name: str) -> Prop_Schema:
+    section = schema[name]
+    assert isinstance(section, Prop_Schema)
+    return section
+
+
+def it_reads_each_typed_dict_once():
+    schema = read_props_from_top_class(Outer)
+    base = [*create_props._partials[Base_Props].values()]
+    left = [*create_props._partials[Left_Props].values()]
+    assert left[:2] == base
+    assert [*create_props._partials[Right_Props].values()][:2] == base
+    assert [p.name for p in left] == ["a", "b", "c"]
+    assert [p.name for p in _section(schema, "left")] == ["a", "b", "c"]
+    assert [p.name for p in _section(schema, "right")] == ["a", "b", "d"]
+
+
+def it_puts_reused_props_at_their_own_path():
+    schema = read_props_from_top_class(Outer)
+    left_a = _section(schema, "left")["a"]
+    right_a = _section(schema, "right")["a"]
+    assert isinstance(left_a, Prop) and isinstance(right_a, Prop)
+    assert left_a.path == ("Outer", "left")
+    assert right_a.path == ("Outer", "right")
+    assert left_a.no_value == right_a.no_value
+    assert left_a.subsection == right_a.subsection == "configure"
+
+
+def it_lets_a_typed_dict_redeclare_an_inherited_key():
+    class Top(TypedDict):
+        inner: Redeclared_Props
+
+    inner = _section(read_props_from_top_class(Top), "inner")
+    assert [p.name for p in inner] == ["a", "b"]
+    b = inner["b"]
+    assert isinstance(b, Prop) and b.no_value == Some(0)
+
+
+class Cache_Test:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return SchemaCache(tmp_path)
+
+    def it_loads_what_it_stored(self, cache: SchemaCache):
+        schema = read_props_from_top_class(Outer)
+        assert cache.load(Outer) is None
+        cache.store(Outer, schema, {__name__})
+        loaded = cache.load(Outer)
+        assert loaded is not None and loaded is not schema
+        assert _dump(loaded) == _dump(schema)
+
+    def it_ignores_an_entry_once_a_source_changes(
+        self, cache: SchemaCache, monkeypatch: pytest.MonkeyPatch
+    ):
+        cache.store(Outer, read_props_from_top_class(Outer), {__name__})
+        monkeypatch.setitem(schema_cache._source_hashes, __name__, 0)
+        assert cache.load(Outer) is None
+
+    def it_ignores_a_corrupt_entry(self, cache: SchemaCache, tmp_path):
+        cache.store(Outer, read_props_from_top_class(Outer), {__name__})
+        for file in tmp_path.iterdir():
+            file.write_bytes(b"not a pickle")
+        assert cache.load(Outer) is None
+
+    def it_is_used_when_the_variable_is_set(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path
+    ):
+        monkeypatch.setenv(ENV_VAR, str(tmp_path))
+        schema = read_props_from_top_class(Outer)
+
+        def fail(cls: type):
+            raise AssertionError(f"{cls} was read again")
+
+        monkeypatch.setattr(create_props, "_read_top_class", fail)
+        assert _dump(read_props_from_top_class(Outer)) == _dump(schema)
@@ -0,0 +1,45 @@
+import logging
+
+import pytest
+
+from react_tk.rendering.actions.actions import ActionLogLine, Update
+
+from bench.stub import Stub, StubRoot
+
+logger = logging.getLogger("react_tk")
+
+
+def _tree(text: str):
+    return Stub(key="root")[[Stub(key="a", text=text), Stub(key="b", text="b")]]
+
+
+def _actions():
+    root = StubRoot()
+    root(_tree("a"))
+    by_key = {action.node.key: action for action in root(_tree("x"))}
+    return by_key["root"], by_key["a"]
+
+
+def it_formats_like_the_action():
+    noop, update = _actions()
+    assert isinstance(noop, Update) and not noop
+    assert str(ActionLogLine(update)) == f"⚖️  RECONCILE {update}"
+    assert str(ActionLogLine(noop)) == f"🚫 RECONCILE {noop.key} "
+
+
+def it_formats_only_when_emitted(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+):
+    formatted = []
+    original = ActionLogLine.__str__
+    monkeypatch.setattr(
+        ActionLogLine, "__str__", lambda self: formatted.append(1) or original(self)
+    )
+    _, update = _actions()
+    with caplog.at_level(logging.WARNING, "react_tk"):
+        logger.info("%s", ActionLogLine(update))
+    assert formatted == []
+    with caplog.at_level(logging.INFO, "react_tk"):
+        logger.info("%s", ActionLogLine(update))
+    assert formatted
+    assert caplog.messages == [f"⚖️  RECONCILE {update}"]
@@ -0,0 +1,44 @@
+from react_tk.renderable.component import AbsCtx
+from react_tk.renderable.node.top import TopLevelNode
+from react_tk.rendering.actions.commit_batch import group_batches
+from react_tk.rendering.actions.compute import ComputeTreeActions
+from react_tk.rendering.actions.reconcile_state import PersistentReconcileState
+from react_tk.rendering.component.render_sink import RenderState
+from react_tk.tk.nodes.label import Label
+from react_tk.tk.nodes.window import Window
+from react_tk.tk.reconcilers.widget_reconciler import WidgetReconciler
+from react_tk.tk.reconcilers.window_reconciler import WindowReconciler
+
+
+def _window(*kids: Label) -> Window:
+    return Window().Geometry(width=1, height=1, x=0, y=0, anchor_point="lt")[kids]
+
+
+def _actions(*windows: Window):
+    rendered = RenderState(AbsCtx()).create_empty_sink().run(windows)
+    top = TopLevelNode(KIDS=rendered, key="top")
+    state = PersistentReconcileState().new_transient()
+    return [*ComputeTreeActions(state).compute_actions(top)]
+
+
+def it_batches_widgets_of_one_window():
+    actions = _actions(_window(Label(text="a"), Label(text="b"), Label(text="c")))
+    batches = [*group_batches(actions)]
+    assert [b.domain for b in batches] == [WindowReconciler, WidgetReconciler]
+    assert [b.size for b in batches] == [1, 3]
+
+
+def it_splits_batches_between_windows():
+    actions = _actions(
+        _window(Label(text="a"), Label(text="b")),
+        _window(Label(text="c")),
+    )
+    batches = [*group_batches(actions)]
+    assert [b.size for b in batches] == [1, 2, 1, 1]
+    assert sum(b.size for b in batches) == len(actions)
+
+
+def it_keeps_action_order():
+    actions = _actions(_window(Label(text="a"), Label(text="b")))
+    flattened = [a for b in group_batches(actions) for a in b.actions]
+    assert flattened == actions
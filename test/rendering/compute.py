@@ -0,0 +1,184 @@
+from dataclasses import dataclass
+from random import Random
+
+import pytest
+
+from react_tk.rendering.actions import fingerprint
+from react_tk.rendering.actions.actions import Place, Unplace, Update
+
+from bench.stub import Stub, StubRoot
+
+
+def _tree(changed: str = "x", width: int = 5):
+    return Stub(key="root")[
+        [
+            Stub(key=f"branch{i}")[Stub(key=f"leaf{i}", text=changed if i == 0 else "")]
+            for i in range(width)
+        ]
+    ]
+
+
+def it_places_everything_on_first_render():
+    root = StubRoot()
+    actions = root(_tree())
+    assert len(actions) == 11
+    assert all(isinstance(a, Place) for a in actions)
+
+
+def it_emits_nothing_for_the_same_subtree():
+    root = StubRoot()
+    tree = _tree()
+    root(tree)
+    assert root(tree) == []
+
+
+def it_emits_nothing_for_an_equal_subtree():
+    root = StubRoot()
+    root(_tree())
+    assert root(_tree()) == []
+
+
+def it_only_walks_the_changed_path():
+    root = StubRoot()
+    root(_tree())
+    actions = root(_tree(changed="y"))
+    assert [a.node.key for a in actions] == ["root", "branch0", "leaf0"]
+    assert all(isinstance(a, Update) for a in actions)
+    assert [bool(a) for a in actions] == [False, False, True]
+
+
+def it_still_places_a_skipped_subtree_next_time():
+    root = StubRoot()
+    root(_tree())
+    root(_tree())
+    actions = root(_tree(changed="y"))
+    assert [a.node.key for a in actions] == ["root", "branch0", "leaf0"]
+
+
+def it_keys_state_by_interned_ids():
+    root = StubRoot()
+    root(_tree())
+    state = root.reconciler.state
+    assert all(isinstance(id, int) for id in state.existing_resources)
+    assert len(state.ids) == 12
+    root(_tree(changed="y"))
+    assert len(state.ids) == 12
+    assert len(state.placed_last) == 12
+
+
+def it_rejects_keyed_siblings_built_on_different_lines():
+    root = StubRoot()
+    tree = Stub(key="f")[
+        Stub(key="x"),
+        Stub(key="x"),
+    ]
+    with pytest.raises(ValueError, match="Duplicates"):
+        root(tree)
+
+
+def it_rejects_keyed_siblings_built_on_one_line():
+    root = StubRoot()
+    with pytest.raises(ValueError, match="Duplicates"):
+        root(Stub(key="f")[[Stub(key="x", text=str(i)) for i in range(2)]])
+
+
+def _built_elsewhere(text: str):
+    return Stub(key="root")[Stub(key="leaf", text=text)]
+
+
+def it_updates_a_keyed_node_built_somewhere_else():
+    root = StubRoot()
+    root(Stub(key="root")[Stub(key="leaf", text="a")])
+    actions = root(_built_elsewhere("b"))
+    assert [(type(a), a.node.key) for a in actions] == [
+        (Update, "root"),
+        (Update, "leaf"),
+    ]
+    assert [bool(a) for a in actions] == [False, True]
+
+
+def _list(*keys: str):
+    return Stub(key="root")[[Stub(key=k, text=k) for k in keys]]
+
+
+def _check_order(root: StubRoot, tree: Stub):
+    assert root.placed_keys(tree) == [kid.key for kid in tree.KIDS]
+
+
+def it_places_only_the_new_head():
+    root = StubRoot()
+    keys = [f"k{i}" for i in range(100)]
+    root(_list(*keys))
+    tree = _list("new", *keys)
+    actions = root(tree)
+    assert [type(a) for a in actions] == [Update, Place]
+    assert actions[1].node.key == "new"
+    _check_order(root, tree)
+
+
+def it_moves_only_what_left_the_increasing_run():
+    root = StubRoot()
+    root(_list("a", "b", "c", "d", "e"))
+    tree = _list("b", "c", "d", "e", "a")
+    actions = root(tree)
+    assert [(type(a), a.node.key) for a in actions] == [(Update, "root"), (Place, "a")]
+    _check_order(root, tree)
+
+
+def it_unplaces_removed_children_first():
+    root = StubRoot()
+    root(_list("a", "b", "c", "d"))
+    tree = _list("d", "a", "c")
+    actions = root(tree)
+    assert [(type(a), a.node.key) for a in actions] == [
+        (Update, "root"),
+        (Unplace, "b"),
+        (Place, "d"),
+    ]
+    _check_order(root, tree)
+
+
+def _built_one_by_one(*keys: str):
+    built = {
+        "a": Stub(key="a", text="a"),
+        "b": Stub(key="b", text="b"),
+        "c": Stub(key="c", text="c"),
+    }
+    return Stub(key="root")[[built[k] for k in keys]]
+
+
+def it_matches_keyed_children_built_at_other_sites():
+    root = StubRoot()
+    root(_built_one_by_one("a", "b", "c"))
+    tree = _list("c", "a", "b")
+    actions = root(tree)
+    assert [(type(a), a.node.key) for a in actions] == [(Update, "root"), (Place, "c")]
+    assert isinstance(actions[1], Place) and isinstance(actions[1].target_prep, Update)
+    _check_order(root, tree)
+
+
+def it_keeps_order_through_shuffles():
+    rng = Random(7)
+    root = StubRoot()
+    keys = [f"k{i}" for i in range(30)]
+    for _ in range(20):
+        rng.shuffle(keys)
+        tree = _list(*keys[: rng.randint(10, 30)])
+        root(tree)
+        _check_order(root, tree)
+
+
+def it_compares_each_pair_of_nodes_once(monkeypatch):
+    root = StubRoot()
+    root(_tree(width=3))
+    seen: list[int] = []
+    shallow_key = fingerprint.shallow_key
+
+    def counted(node):
+        seen.append(id(node))
+        return shallow_key(node)
+
+    monkeypatch.setattr(fingerprint, "shallow_key", counted)
+    root(_tree(changed="y", width=3))
+    # The root, three branches and three leaves, old and new.
+    assert len(seen) == len(set(seen)) == 14
@@ -0,0 +1,54 @@
+import gc
+
+from react_tk.renderable.trace import ConstructTraceAccessor
+from react_tk.util import stack
+
+from bench.stub import Stub
+
+
+def _construct():
+    return [Stub(text=str(i)) for i in range(3)]
+
+
+def it_interns_the_construct_trace_per_call_site():
+    a, b, c = _construct()
+    traces = {id(ConstructTraceAccessor(x).get()) for x in (a, b, c)}
+    assert len(traces) == 1
+
+
+def it_points_at_the_constructing_line():
+    node = Stub(text="x")
+    trace = ConstructTraceAccessor(node).get()
+    assert trace.filename == __file__
+    assert trace.function_name == "it_points_at_the_constructing_line"
+    assert trace.line == it_points_at_the_constructing_line.__code__.co_firstlineno + 1
+
+
+def it_keeps_the_construct_trace_through_setters():
+    node = Stub(text="x")
+    kids = node[Stub(text="y")]
+    assert ConstructTraceAccessor(kids).get() is ConstructTraceAccessor(node).get()
+
+
+def it_tells_apart_equal_functions_in_different_files():
+    source = "def make(stub):\n    return stub(text='x')\n"
+    made = []
+    for filename in ("a.py", "b.py"):
+        scope: dict = {}
+        exec(compile(source, filename, "exec"), scope)
+        made.append(scope["make"](Stub))
+    a, b = (ConstructTraceAccessor(x).get() for x in made)
+    assert (a.filename, b.filename) == ("a.py", "b.py")
+
+
+def it_forgets_the_call_sites_of_collected_code():
+    scope: dict = {}
+    exec(compile("def make(stub):\n    return stub(text='x')\n", "c.py", "exec"), scope)
+    code = scope["make"].__code__
+    trace = ConstructTraceAccessor(scope["make"](Stub)).get()
+    assert trace.filename == "c.py"
+    assert id(code) in stack._call_sites
+    key = id(code)
+    del scope, code
+    gc.collect()
+    assert key not in stack._call_sites
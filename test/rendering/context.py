@@ -0,0 +1,51 @@
+from copy import copy
+import gc
+import threading
+
+from react_tk.renderable.context import Ctx, ctx_snapshot
+from react_tk.util.async_loop import SharedEventLoop, shared_loop
+
+
+def it_shares_one_loop_between_contexts():
+    a = Ctx(x=1)
+    b = ctx_snapshot(a)
+    assert a._loop is b._loop
+
+
+def it_keeps_the_thread_count_constant():
+    keep = Ctx()
+    before = threading.active_count()
+    contexts = [Ctx(i=i) for i in range(10_000)]
+    assert threading.active_count() == before
+    assert shared_loop.users >= len(contexts)
+    del contexts
+    gc.collect()
+    assert threading.active_count() == before
+    del keep
+
+
+def it_stops_the_loop_after_the_last_release():
+    shared = SharedEventLoop("test")
+    loop = shared.acquire()
+    assert shared.acquire() is loop
+    thread = shared.thread
+    assert thread and thread.is_alive()
+    shared.release()
+    assert thread.is_alive()
+    shared.release()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert loop.is_closed()
+    assert shared.acquire() is not loop
+    shared.release()
+
+
+def it_holds_the_loop_for_a_copy():
+    keep = Ctx()
+    before = shared_loop.users
+    copied = copy(keep)
+    assert copied._loop is keep._loop
+    assert shared_loop.users == before + 1
+    del copied
+    gc.collect()
+    assert shared_loop.users == before
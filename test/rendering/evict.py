@@ -0,0 +1,76 @@
+from bench.stub import Stub, StubRoot
+
+
+def _list(*keys: str):
+    return Stub(key="root")[[Stub(key=k, text=k)[Stub(key="kid")] for k in keys]]
+
+
+def _resource(root: StubRoot, key: str):
+    (rendered,) = [
+        r
+        for r in root.reconciler.state.existing_resources.values()
+        if r.node.key == key
+    ]
+    return rendered.resource
+
+
+def it_keeps_unplaced_nodes_until_they_age_out():
+    root = StubRoot(evict_after=3)
+    root(_list("a", "b"))
+    b = _resource(root, "b")
+    state = root.reconciler.state
+    for _ in range(2):
+        root(_list("a"))
+    assert not b.evicted
+    assert len(state.existing_resources) == 6
+    root(_list("a"))
+    assert b.evicted
+    assert len(state.existing_resources) == 4
+    assert state.evicted == 2
+
+
+def it_forgets_the_ids_of_evicted_nodes():
+    root = StubRoot(evict_after=1)
+    state = root.reconciler.state
+    root(_list("a", "b"))
+    root(_list("a"))
+    assert len(state.ids) == 4
+    assert not state.unplaced_since
+
+
+def it_creates_an_evicted_node_again_when_it_comes_back():
+    root = StubRoot(evict_after=1)
+    root(_list("a", "b"))
+    root(_list("a"))
+    actions = root(_list("a", "b"))
+    assert [a.node.key for a in actions] == ["root", "b", "kid"]
+    assert [kid.props["text"] for kid in _resource(root, "root").kids] == ["a", "b"]
+
+
+def it_forgets_nodes_that_come_back_in_time():
+    root = StubRoot(evict_after=2)
+    root(_list("a", "b"))
+    root(_list("a"))
+    root(_list("a", "b"))
+    for _ in range(3):
+        root(_list("a", "b"))
+    assert root.reconciler.state.evicted == 0
+
+
+def it_never_evicts_without_a_limit():
+    root = StubRoot()
+    root(_list("a", "b"))
+    for _ in range(5):
+        root(_list("a"))
+    assert root.reconciler.state.evicted == 0
+
+
+def it_reuses_the_ids_of_evicted_nodes():
+    root = StubRoot(evict_after=1)
+    ids = root.reconciler.state.ids
+    for i in range(10):
+        root(_list("a", f"b{i}"))
+        root(_list("a"))
+    assert len(ids._uids) <= 6
+    root(_list("a", "c"))
+    assert [kid.props["text"] for kid in _resource(root, "root").kids] == ["a", "c"]
@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Any
+
+from react_tk.renderable.component import Component
+from react_tk.rendering.actions.actions import Place, Replace
+
+from react_tk.rendering.hooks import (
+    ActionRun,
+    ActionsComputed,
+    Hook,
+    RenderEnd,
+    RenderStart,
+)
+
+from .render_root import Text, make_root
+from bench.stub import Stub
+
+
+@dataclass(kw_only=True)
+class Pair(Component[Stub]):
+    def render(self):
+        return [Text(), Stub(key="other")]
+
+
+def _record(root) -> list[Any]:
+    events: list[Any] = []
+    hooks = root.hooks
+    hooks.on_render_start += events.append
+    hooks.on_render_end += events.append
+    hooks.on_compute_actions += events.append
+    hooks.on_commit_batch += events.append
+    hooks.on_action += events.append
+    return events
+
+
+def it_reports_each_phase_of_a_frame():
+    root = make_root(coalesce=False)
+    events = _record(root)
+    root(a="x")
+    start, end, computed, run, batch = events
+    assert start == RenderStart(2)
+    assert isinstance(end, RenderEnd) and end.frame == 2
+    assert end.nodes == 1 and end.duration >= 0
+    assert isinstance(computed, ActionsComputed)
+    assert computed.counts == {"Update": 1} and computed.size == 1
+    assert batch.counts == computed.counts
+    assert isinstance(run, ActionRun) and run.action.node.key == "text"
+    assert len(events) == 5
+
+
+def it_times_every_action():
+    root = make_root(coalesce=False)
+    runs: list[ActionRun] = []
+    root.hooks.on_action += runs.append
+    root._mounted = Pair()
+    root(a="x")
+    assert [(type(r.action), r.action.node.key) for r in runs] == [
+        (Replace, "text"),
+        (Place, "other"),
+    ]
+    assert all(r.duration >= 0 for r in runs)
+
+
+def it_stops_calling_a_removed_listener():
+    root = make_root(coalesce=False)
+    starts: list[RenderStart] = []
+    root.hooks.on_render_start += starts.append
+    root(a="x")
+    root.hooks.on_render_start -= starts.append
+    root(a="y")
+    assert starts == [RenderStart(2)]
+
+
+def it_keeps_going_when_a_listener_fails():
+    hook = Hook[int]()
+    seen: list[int] = []
+
+    def fail(_: int):
+        raise RuntimeError()
+
+    hook += fail
+    hook += seen.append
+    hook(1)
+    assert seen == [1]
+
+
+def it_is_falsy_without_listeners():
+    hook = Hook[int]()
+    assert not hook
+    hook += print
+    assert hook
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+
+def _loaded_after(statement: str) -> set[str]:
+    out = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(out.split())
+
+
+def it_imports_nothing_heavy_for_the_package():
+    loaded = _loaded_after("import react_tk")
+    assert not {"tkinter", "typeguard", "react_tk.tk.nodes.label"} & loaded
+
+
+def it_renders_without_tk_or_typeguard():
+    loaded = _loaded_after("import react_tk.rendering.component.render_sink")
+    assert not {"tkinter", "typeguard"} & loaded
+
+
+def it_imports_an_export_on_access():
+    loaded = _loaded_after("from react_tk import Label")
+    assert "react_tk.tk.nodes.label" in loaded
+    assert "react_tk.tk.mount" not in loaded
+
+
+def it_lists_every_export():
+    import react_tk
+
+    assert set(react_tk.__all__) <= set(dir(react_tk))
+    for name in react_tk.__all__:
+        assert getattr(react_tk, name) is not None
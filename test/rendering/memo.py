@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+import pytest
+
+from react_tk.renderable.component import Component, memo
+from react_tk.renderable.context import Ctx
+from react_tk.rendering.component.memo import MemoCache
+from react_tk.rendering.component.render_sink import RenderState
+from react_tk.tk.nodes.frame import Frame
+from react_tk.tk.nodes.label import Label
+
+renders: list[str] = []
+
+
+@memo
+@dataclass(kw_only=True)
+class Leaf(Component[Label]):
+    text: str
+
+    def render(self):
+        renders.append(f"leaf:{self.text}")
+        return Label(text=f"{self.text}{self.ctx.suffix}")
+
+
+@memo
+@dataclass(kw_only=True)
+class Branch(Component[Frame]):
+    def render(self):
+        renders.append("branch")
+        return Frame(background=self.ctx.color)[Leaf(text="a"), Leaf(text="b")]
+
+
+@dataclass(kw_only=True)
+class Plain(Component[Frame]):
+    text: str
+
+    def render(self):
+        renders.append("plain")
+        return Frame()[Leaf(text=self.text)]
+
+
+@pytest.fixture
+def ctx():
+    renders.clear()
+    ctx = Ctx(suffix="!", color="red", unrelated=1)
+    yield ctx
+
+
+def _plain(text: str) -> Plain:
+    return Plain(text=text)
+
+
+def _render(ctx: Ctx, cache: MemoCache, root: Component[Any]):
+    result = RenderState(ctx, memo=cache).create_empty_sink().run(root)
+    cache.commit()
+    return result
+
+
+def it_reuses_output_when_nothing_changed(ctx: Ctx):
+    cache = MemoCache()
+    first = _render(ctx, cache, _plain("x"))
+    second = _render(ctx, cache, _plain("x"))
+    assert renders == ["plain", "leaf:x", "plain"]
+    assert [*first[0].KIDS][0] is [*second[0].KIDS][0]
+    assert cache.hits == 1
+
+
+def it_ignores_unrelated_ctx_keys(ctx: Ctx):
+    cache = MemoCache()
+    _render(ctx, cache, _plain("x"))
+    ctx._map["unrelated"] = 2
+    _render(ctx, cache, _plain("x"))
+    assert renders.count("leaf:x") == 1
+
+
+def it_rerenders_when_a_read_key_changes(ctx: Ctx):
+    cache = MemoCache()
+    _render(ctx, cache, _plain("x"))
+    ctx._map["suffix"] = "?"
+    frame, *_ = _render(ctx, cache, _plain("x"))
+    assert renders.count("leaf:x") == 2
+    assert [*frame.KIDS][0].PROPS.compute()["configure"]["text"] == "x?"
+
+
+def it_rerenders_when_fields_change(ctx: Ctx):
+    cache = MemoCache()
+    _render(ctx, cache, _plain("x"))
+    _render(ctx, cache, _plain("y"))
+    assert renders == ["plain", "leaf:x", "plain", "leaf:y"]
+
+
+def it_tracks_reads_of_nested_components(ctx: Ctx):
+    cache = MemoCache()
+    root = Branch()
+    _render(ctx, cache, root)
+    ctx._map["suffix"] = "?"
+    _render(ctx, cache, root)
+    assert renders.count("branch") == 2
+
+
+def it_keeps_nested_entries_across_parent_hits(ctx: Ctx):
+    cache = MemoCache()
+    root = Branch()
+    _render(ctx, cache, root)
+    _render(ctx, cache, root)
+    ctx._map["color"] = "blue"
+    _render(ctx, cache, root)
+    assert renders == ["branch", "leaf:a", "leaf:b", "branch"]
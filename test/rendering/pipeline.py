@@ -0,0 +1,74 @@
+import threading
+from typing import Any
+
+from react_tk.rendering.pipeline import FrameCommitter
+
+from .render_root import _rendered_text, make_root
+
+
+class SlowCommit:
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.frames: list[Any] = []
+
+    def __call__(self, frame: Any) -> None:
+        self.started.set()
+        self.release.wait(5)
+        self.frames.append(frame)
+
+
+def it_drops_frames_superseded_before_their_commit():
+    commit = SlowCommit()
+    committer = FrameCommitter(commit, name="test")
+    committer.submit(("a",))  # type: ignore[arg-type]
+    commit.started.wait(5)
+    committer.submit(("b",))  # type: ignore[arg-type]
+    committer.submit(("c",))  # type: ignore[arg-type]
+    commit.release.set()
+    assert committer.wait_idle(5)
+    assert commit.frames == [("a",), ("c",)]
+    assert committer.committed == 2
+    assert committer.dropped == 1
+    committer.stop()
+
+
+def it_commits_off_the_rendering_thread():
+    threads = []
+    committer = FrameCommitter(
+        lambda _: threads.append(threading.current_thread()), name="test"
+    )
+    committer.submit(())
+    assert committer.wait_idle(5)
+    assert threads == [committer._thread]
+    committer.stop()
+    committer._thread.join(5)
+    assert not committer._thread.is_alive()
+
+
+def it_renders_and_commits_in_pipelined_mode():
+    root = make_root(pipeline=True, max_fps=None)
+    root(a="x")
+    root(b="y")
+    root.flush()
+    assert _rendered_text(root) == "xy"
+
+
+def it_submits_frames_while_rendering_is_locked():
+    root = make_root(pipeline=True, coalesce=False)
+    committer = root._committer
+    assert committer
+    submit = committer.submit
+    locked: list[bool] = []
+
+    def checked(frame: Any) -> None:
+        # Else another thread could render and submit in between, and this
+        # older frame would replace its newer one.
+        locked.append(root._render_lock._is_owned())  # type: ignore[attr-defined]
+        submit(frame)
+
+    committer.submit = checked  # type: ignore[method-assign]
+    root(a="x")
+    root(b="y")
+    root.flush()
+    assert locked == [True, True]
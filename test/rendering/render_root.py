@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+import threading
+from typing import Any
+
+from react_tk.renderable.component import Component
+from react_tk.rendering.options import RenderOptions
+from react_tk.rendering.render_root import RenderRoot
+
+from bench.stub import Stub
+
+
+@dataclass(kw_only=True)
+class Text(Component[Stub]):
+    def render(self):
+        return Stub(key="text", text=f"{self.ctx.a}{self.ctx.b}")
+
+
+def make_root(**options: Any) -> RenderRoot[Any]:
+    return RenderRoot(Text(), options=RenderOptions(**options), a="", b="")
+
+
+def _rendered_text(root: RenderRoot[Any]) -> str:
+    [rendered] = [
+        r
+        for r in root._reconciler.state.existing_resources.values()
+        if r.node.key == "text"
+    ]
+    return rendered.resource.props["text"]
+
+
+def it_renders_every_update_without_coalescing():
+    root = make_root(coalesce=False)
+    root(a="x")
+    root(b="y")
+    assert root.frames == 3
+    assert _rendered_text(root) == "xy"
+
+
+def it_coalesces_updates_until_flushed():
+    root = make_root(max_fps=None)
+    hold = threading.Event()
+    root.ctx._loop.call_soon_threadsafe(hold.wait, 5)
+    root(a="x")
+    root.ctx.b = "y"
+    root(a="z")
+    assert root.frames == 1
+    root.flush()
+    assert root.frames == 2
+    assert root.updates == 3
+    assert _rendered_text(root) == "zy"
+    hold.set()
+    _wait_for_loop(root)
+    assert root.frames == 2
+
+
+def it_renders_on_the_next_tick():
+    root = make_root(max_fps=None)
+    root(a="x", b="y")
+    _wait_for_loop(root)
+    assert root.frames == 2
+    assert _rendered_text(root) == "xy"
+
+
+def _wait_for_loop(root: RenderRoot[Any]) -> None:
+    done = threading.Event()
+    loop = root.ctx._loop
+    # Timers run in order of their deadlines, so this runs after any flush
+    # that was already due.
+    loop.call_soon_threadsafe(loop.call_later, 0.01, done.set)
+    done.wait(5)
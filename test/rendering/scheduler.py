@@ -0,0 +1,147 @@
+import threading
+import time
+from typing import Any
+
+from react_tk.renderable.context import Ctx
+
+from .render_root import make_root
+
+
+def _wait(ctx: Ctx, delay: float = 0.05) -> None:
+    done = threading.Event()
+    ctx._loop.call_soon_threadsafe(ctx._loop.call_later, delay, done.set)
+    assert done.wait(5)
+
+
+def _on_loop(ctx: Ctx, func: Any) -> None:
+    """Runs *func* on the loop, so no frame can run while it does."""
+    ctx._loop.call_soon_threadsafe(func)
+    _wait(ctx)
+
+
+def it_runs_a_schedule_if_the_context_is_unchanged():
+    ctx = Ctx(a=1)
+    ran: list[Any] = []
+    ctx.schedule(delay=0.01)(ran.append, 1)
+    _wait(ctx)
+    assert ran == [1]
+
+
+def it_skips_a_schedule_once_the_context_changes():
+    ctx = Ctx(a=1)
+    ran: list[Any] = []
+    ctx.schedule(delay=0.01)(ran.append, 1)
+    ctx.schedule(delay=0.01, always_run=True)(ran.append, 2)
+    ctx.a = 2
+    _wait(ctx)
+    assert ran == [2]
+
+
+def it_ignores_setting_the_same_value():
+    ctx = Ctx(a=1)
+    version = ctx._version
+    ctx(a=1)
+    assert ctx._version == version
+    ctx(a=2)
+    assert ctx._version == version + 1
+
+
+def it_cancels_a_schedule():
+    ctx = Ctx()
+    ran: list[Any] = []
+    handle = ctx.schedule(delay=0.01)(ran.append, 1)
+    handle.cancel()
+    _wait(ctx)
+    assert ran == [] and handle.cancelled
+
+
+def it_repeats_until_cancelled():
+    ctx = Ctx()
+    ticks = threading.Semaphore(0)
+    handle = ctx.every(interval=0.005)(ticks.release)
+    for _ in range(5):
+        assert ticks.acquire(timeout=5)
+    handle.cancel()
+    _wait(ctx)
+    while ticks.acquire(blocking=False):
+        pass
+    _wait(ctx)
+    assert not ticks.acquire(blocking=False)
+
+
+def it_keeps_repeating_through_context_changes():
+    ctx = Ctx(a=0)
+    ticks = threading.Semaphore(0)
+
+    def tick():
+        ctx.a += 1
+        ticks.release()
+
+    handle = ctx.every(interval=0.005)(tick)
+    for _ in range(3):
+        assert ticks.acquire(timeout=5)
+    handle.cancel()
+    assert ctx.a >= 3
+
+
+def it_runs_a_frame_s_requests_together():
+    ctx = Ctx()
+    ran: list[tuple[str, float]] = []
+
+    def request():
+        ctx.next_frame(lambda: ran.append(("a", ctx._last_frame)))
+        ctx.next_frame(lambda: ran.append(("b", ctx._last_frame)))
+
+    _on_loop(ctx, request)
+    [(_, first), (_, second)] = ran
+    assert [name for name, _ in ran] == ["a", "b"]
+    assert first == second
+
+
+def it_paces_frames():
+    ctx = Ctx()
+    ctx.frame_interval = 0.02
+    frames: list[float] = []
+    done = threading.Event()
+
+    def animate():
+        # When the frame started, since this can run late on a busy loop.
+        frames.append(ctx._last_frame)
+        if len(frames) < 4:
+            ctx.next_frame(animate)
+        else:
+            done.set()
+
+    ctx.next_frame(animate)
+    assert done.wait(5)
+    gaps = [b - a for a, b in zip(frames, frames[1:])]
+    assert all(gap >= 0.019 for gap in gaps)
+
+
+def it_cancels_a_frame_request():
+    ctx = Ctx()
+    ran: list[int] = []
+
+    def request():
+        ctx.next_frame(ran.append, 1).cancel()
+        ctx.next_frame(ran.append, 2)
+
+    _on_loop(ctx, request)
+    assert ran == [2]
+
+
+def it_renders_what_a_frame_changed_at_once():
+    root = make_root(max_fps=50)
+    assert root.ctx.frame_interval == 1 / 50
+    start = root.frames
+
+    def step():
+        root.ctx.a = "x"
+        root.ctx.b = "y"
+
+    root.ctx.next_frame(step)
+    deadline = time.monotonic() + 5
+    while root.frames == start and time.monotonic() < deadline:
+        _wait(root.ctx, 0.01)
+    _wait(root.ctx)
+    assert root.frames == start + 1
@@ -0,0 +1,63 @@
+from react_tk.renderable.component import AbsCtx
+from react_tk.renderable.trace import RenderFrame, RenderTrace, RenderTraceAccessor
+from react_tk.rendering.actions.reconcile_state import TraceIds
+from react_tk.rendering.component.render_sink import RenderState
+
+from bench.stub import Stub
+
+
+def _frame(key: str, seq_id: int = 0):
+    return RenderFrame(type_name="Stub", lineno=1, col_no=0, key=key).to_sequenced(
+        seq_id
+    )
+
+
+def it_shares_the_parent_when_extended():
+    parent = RenderTrace(_frame("a"), _frame("b"))
+    child = parent + _frame("c")
+    assert child.parent is parent
+    assert child.depth == 3
+    assert child.frames == (_frame("a"), _frame("b"), _frame("c"))
+
+
+def it_equals_a_trace_built_from_the_same_frames():
+    built = RenderTrace() + _frame("a") + _frame("b")
+    assert built == RenderTrace(_frame("a"), _frame("b"))
+    assert hash(built) == hash(RenderTrace(_frame("a"), _frame("b")))
+    assert built != RenderTrace(_frame("a"), _frame("b", seq_id=1))
+    assert built != RenderTrace(_frame("a"))
+    assert RenderTrace() == RenderTrace()
+
+
+def it_joins_strings_like_the_frames_do():
+    trace = RenderTrace(_frame("a"), _frame("b"), _frame(""))
+    assert trace.to_string("id") == "a.b:1₀〉Stub"
+    assert trace.to_string("short-id") == ":1₀〉Stub"
+    assert trace.to_string("safe") == "a__b__0_1_stub"
+
+
+def it_renders_deep_trees_with_linked_traces():
+    node = leaf = Stub(key="leaf")
+    for i in range(150):
+        node = Stub(key=f"n{i}")[node]
+    (rendered,) = RenderState(AbsCtx()).create_empty_sink().run(node)
+    while rendered.KIDS:
+        (rendered,) = rendered.KIDS
+    trace = RenderTraceAccessor(rendered).get()
+    assert trace.depth == 151
+    assert trace.top and trace.top.key == leaf.key
+
+
+def it_derives_info_from_the_latest_trace():
+    node = Stub(key="leaf")
+    accessor = RenderTraceAccessor(node)
+    accessor.set(RenderTrace(_frame("a"), _frame("b")))
+    assert node.__info__.uid == "a.b"
+    ids = TraceIds()
+    first = ids.of(node)
+    assert hash(node.__info__.trace) == hash(RenderTrace(_frame("a"), _frame("b")))
+    accessor.set(RenderTrace(_frame("a"), _frame("c")))
+    assert node.__info__.uid == "a.c"
+    assert node.__info__.short_id == "c"
+    assert node.__info__.trace == RenderTrace(_frame("a"), _frame("c"))
+    assert ids.of(node) != first and ids.uid(ids.of(node)) == "a.c"
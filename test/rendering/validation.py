@@ -0,0 +1,54 @@
+import pytest
+
+from react_tk.props.impl.prop import Prop
+from react_tk.renderable.component import AbsCtx
+from react_tk.rendering.component.render_sink import RenderState
+from react_tk.rendering.component.validation import Validator
+
+from bench.stub import Stub
+
+
+def _render(validator: Validator, *nodes: Stub):
+    return RenderState(AbsCtx(), validate=validator).create_empty_sink().run(nodes)
+
+
+def _bad():
+    return Stub(text=5)  # type: ignore[arg-type]
+
+
+def it_validates_always_by_default():
+    with pytest.raises(ValueError):
+        RenderState(AbsCtx()).create_empty_sink().run(_bad())
+
+
+def it_skips_validation_when_off():
+    validator = Validator("off")
+    _render(validator, _bad())
+    assert validator.stats.checked == 0
+    assert validator.stats.skipped == 1
+
+
+def it_validates_each_construct_site_once():
+    validator = Validator("first-seen")
+    for _ in range(3):
+        a = Stub(text="a")
+        b = Stub(text="b")
+        _render(validator, a, b)
+    assert validator.stats.checked == 2
+    assert validator.stats.skipped == 4
+
+
+def it_samples_at_the_given_rate():
+    validator = Validator("sampled", sample_rate=0.0)
+    _render(validator, _bad(), _bad())
+    assert validator.stats.skipped == 2
+    validator = Validator("sampled", sample_rate=1.0)
+    with pytest.raises(ValueError):
+        _render(validator, _bad())
+
+
+def it_caches_passing_scalar_checks_per_type():
+    [node] = _render(Validator(), Stub(text="a"))
+    prop = node.PROPS.prop["text"]
+    assert isinstance(prop, Prop)
+    assert prop._passed == {str}
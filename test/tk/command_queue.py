@@ -0,0 +1,68 @@
+from queue import SimpleQueue
+import threading
+from typing import Any, cast
+
+from react_tk.tk.util.command_queue import CommandQueue, barrier
+
+
+class FakeRoot:
+    """Stands in for a Tk root: `after(0, ...)` callbacks run on its own thread."""
+
+    def __init__(self) -> None:
+        self.scheduled = 0
+        self._callbacks: SimpleQueue[Any] = SimpleQueue()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def after(self, ms: int, callback: Any) -> None:
+        self.scheduled += 1
+        self._callbacks.put(callback)
+
+    def _loop(self) -> None:
+        while True:
+            self._callbacks.get()()
+
+
+def _queue(root: FakeRoot) -> CommandQueue:
+    return CommandQueue(cast(Any, root))
+
+
+def it_runs_commands_in_order_on_the_ui_thread():
+    root = FakeRoot()
+    queue = _queue(root)
+    ran: list[tuple[int, threading.Thread]] = []
+    for i in range(100):
+        queue.post(lambda i=i: ran.append((i, threading.current_thread())))
+    queue.barrier()
+    assert [i for i, _ in ran] == list(range(100))
+    assert {t for _, t in ran} == {root.thread}
+
+
+def it_schedules_far_fewer_drains_than_commands():
+    root = FakeRoot()
+    queue = _queue(root)
+    gate = threading.Event()
+    queue.post(gate.wait)
+    for _ in range(100):
+        queue.post(lambda: None)
+    gate.set()
+    queue.barrier()
+    assert root.scheduled <= 3
+
+
+def it_keeps_going_after_a_failing_command():
+    queue = _queue(FakeRoot())
+    ran = []
+    queue.post(lambda: 1 / 0)
+    queue.post(lambda: ran.append(1))
+    queue.barrier()
+    assert ran == [1]
+
+
+def it_waits_on_several_queues():
+    queues = [_queue(FakeRoot()) for _ in range(3)]
+    ran = []
+    for i, queue in enumerate(queues):
+        queue.post(lambda i=i: ran.append(i))
+    barrier(*queues)
+    assert sorted(ran) == [0, 1, 2]
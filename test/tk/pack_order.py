@@ -0,0 +1,80 @@
+from typing import Any
+
+import pytest
+
+from react_tk.tk.util.pack_order import PackOrder
+from react_tk.tk.util.tk import After, Before
+
+
+class FakeWidget:
+    """Just enough of a widget for the pack order model: a master, and the
+    slaves Tcl would report."""
+
+    def __init__(self, name: str, master: "FakeWidget | None" = None) -> None:
+        self.name = name
+        self.master = master
+        self.actual: list[FakeWidget] = []
+
+    def pack_slaves(self) -> list["FakeWidget"]:
+        return self.actual
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+def _widgets(*names: str) -> tuple[Any, ...]:
+    root = FakeWidget("root")
+    return (root, *(FakeWidget(name, root) for name in names))
+
+
+def it_tracks_placements_by_anchor():
+    order = PackOrder()
+    root, a, b, c = _widgets("a", "b", "c")
+    order.pack(a, root)
+    order.pack(c, root, After(a))
+    order.pack(b, root, Before(c))
+    assert order.slaves(root) == [a, b, c]
+    order.pack(c, root, order.position(root, c, None))
+    assert order.slaves(root) == [c, a, b]
+
+
+def it_anchors_like_pack_slaves_would():
+    order = PackOrder()
+    root, a, b = _widgets("a", "b")
+    assert order.position(root, a, None) is None
+    order.pack(a, root)
+    assert order.position(root, a, None) is None
+    assert order.position(root, b, None) == Before(a)
+    assert order.position(root, b, a) == After(a)
+
+
+def it_only_appends_unpacked_widgets_on_configure():
+    order = PackOrder()
+    root, a, b = _widgets("a", "b")
+    order.configure(b)
+    order.configure(a)
+    order.pack(a, root, Before(b))
+    order.configure(a)
+    assert order.slaves(root) == [a, b]
+
+
+def it_knows_what_sits_in_limbo():
+    order = PackOrder()
+    root, limbo, a = _widgets("limbo", "a")
+    assert not order.is_placed(a)
+    order.pack(a, root)
+    assert order.is_placed(a)
+    order.unplace(a, limbo)
+    assert not order.is_placed(a)
+    assert order.container_of(a) is limbo
+    assert order.slaves(root) == []
+
+
+def it_checks_against_tcl_when_verifying(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(PackOrder, "verify", True)
+    order = PackOrder()
+    root, a, b = _widgets("a", "b")
+    root.actual = [a]
+    order.pack(a, root)
+    with pytest.raises(AssertionError):
+        order.pack(b, root, Before(a))
@@ -0,0 +1,51 @@
+from typing import Any
+
+from react_tk.tk.util.widget_pool import WidgetPool, reset_options
+
+
+class FakeWidget:
+    def __init__(self) -> None:
+        self.options = {"text": ("text", "text", "Text", "", "hello")}
+        self.packed = True
+        self.destroyed = False
+
+    def configure(self, **changes: Any) -> dict[str, tuple[str, ...]]:
+        for name, value in changes.items():
+            self.options[name] = (*self.options[name][:4], value)
+        return {**self.options, "bd": ("bd", "-borderwidth")}
+
+    def pack_forget(self) -> None:
+        self.packed = False
+
+    def destroy(self) -> None:
+        self.destroyed = True
+
+
+def it_resets_options_to_their_defaults():
+    widget: Any = FakeWidget()
+    reset_options(widget)
+    assert widget.options["text"][4] == ""
+
+
+def it_reuses_released_widgets_of_the_same_kind():
+    pool = WidgetPool()
+    widget: Any = FakeWidget()
+    assert pool.acquire("label") is None
+    pool.release("label", widget)
+    assert not widget.packed
+    assert pool.acquire("button") is None
+    assert pool.acquire("label") is widget
+    assert widget.options["text"][4] == ""
+    assert (pool.stats.hits, pool.stats.misses) == (1, 2)
+    assert len(pool) == 0
+
+
+def it_evicts_the_oldest_past_capacity():
+    pool = WidgetPool(capacity=2)
+    widgets: list[Any] = [FakeWidget() for _ in range(3)]
+    for widget in widgets:
+        pool.release("label", widget)
+    assert [w.destroyed for w in widgets] == [True, False, False]
+    assert pool.size("label") == 2
+    assert pool.stats.evicted == 1
+    assert pool.acquire("label") is widgets[2]
@@ -0,0 +1,50 @@
+from queue import SimpleQueue
+import threading
+import time
+from typing import Any
+
+from react_tk.renderable.component import AbsCtx
+from react_tk.rendering.actions.actions import RenderedNode, Unplace
+from react_tk.rendering.actions.reconcile_state import PersistentReconcileState
+from react_tk.rendering.component.render_sink import RenderState
+from react_tk.rendering.hooks import ActionRun, RenderHooks
+from react_tk.tk.nodes.window import Window
+from react_tk.tk.reconcilers.window_reconciler import WindowReconciler
+
+
+class SlowRoot:
+    """Stands in for a Tk root whose `withdraw()` takes a while on its thread."""
+
+    def __init__(self) -> None:
+        self.withdrawn_on: threading.Thread | None = None
+        self._callbacks: SimpleQueue[Any] = SimpleQueue()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def after(self, ms: int, callback: Any) -> None:
+        self._callbacks.put(callback)
+
+    def withdraw(self) -> None:
+        time.sleep(0.05)
+        self.withdrawn_on = threading.current_thread()
+
+    def _loop(self) -> None:
+        while True:
+            self._callbacks.get()()
+
+
+def it_times_window_actions_through_their_tk_work():
+    window = Window().Geometry(width=1, height=1, x=0, y=0, anchor_point="lt")
+    (rendered,) = RenderState(AbsCtx()).create_empty_sink().run(window)
+    hooks = RenderHooks()
+    runs: list[ActionRun] = []
+    hooks.on_action += runs.append
+    state = PersistentReconcileState().new_transient()
+    state.hooks = hooks
+    root = SlowRoot()
+    action: Any = Unplace(RenderedNode(root, rendered))
+    WindowReconciler.run_batch(state, [action])
+    assert root.withdrawn_on is root.thread
+    [run] = runs
+    assert run.action is action
+    assert run.duration >= 0.05